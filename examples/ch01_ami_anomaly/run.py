@@ -1,20 +1,67 @@
 """Run script for AMI Anomaly Detection example."""
 
+import hashlib
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-import yaml
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    import json
+
+    HAS_ORJSON = False
 
 from gridsmith import GridSmithClient
 from gridsmith.api.config import AMIAnomalyConfig
+from gridsmith.core.io import load_yaml
 
 # Get the example directory
 example_dir = Path(__file__).parent
 config_path = example_dir.parent.parent / "configs" / "ami_anomaly.yaml"
 
-# Load config from YAML
-with open(config_path) as f:
-    config_dict = yaml.safe_load(f)
+
+def load_config_cached(path: Path) -> dict[str, Any]:
+    """Load a YAML config, serving it from a JSON side-car cache when fresh.
+
+    The cache lives next to the YAML file (``<name>.yaml.json``) and is keyed
+    on a sha256 prefix of the YAML bytes, so edits invalidate it automatically.
+
+    Args:
+        path: Path to YAML config file
+
+    Returns:
+        Dictionary with configuration
+    """
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    cache_path = path.with_suffix(".yaml.json")
+
+    if cache_path.exists():
+        raw = cache_path.read_bytes()
+        try:
+            cached = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        except ValueError:
+            cached = None
+        if isinstance(cached, dict) and cached.get("hash") == digest:
+            return cached["config"]
+
+    config = load_yaml(path)
+    blob = {"hash": digest, "config": config}
+    try:
+        cache_path.write_bytes(
+            orjson.dumps(blob) if HAS_ORJSON else json.dumps(blob).encode()
+        )
+    except (OSError, TypeError):
+        # Read-only checkout or non-JSON-serializable config: skip caching
+        pass
+    return config
+
+
+# Load config from YAML (cached as JSON between runs)
+config_dict = load_config_cached(config_path)
 
 # Create config object
 config = AMIAnomalyConfig(**config_dict)
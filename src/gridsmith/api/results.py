@@ -3,12 +3,18 @@
 This module provides structured result objects for API responses.
 """
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+# Result objects are immutable and, on Python 3.10+, slotted (no per-instance __dict__)
+_RESULT_DATACLASS_OPTIONS: dict[str, Any] = (
+    {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+)
 
-@dataclass
+
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class AMIAnomalyResults:
     """Results from AMI anomaly detection."""
 
@@ -36,7 +42,7 @@ class AMIAnomalyResults:
         return Path(plot_path) if plot_path else None
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class OutageDetectionResults:
     """Results from outage detection."""
 
@@ -47,7 +53,7 @@ class OutageDetectionResults:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class AssetDegradationResults:
     """Results from asset degradation analysis."""
 
@@ -58,7 +64,7 @@ class AssetDegradationResults:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class LoadShapeResults:
     """Results from load shape analysis."""
 
@@ -69,7 +75,7 @@ class LoadShapeResults:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class TemperatureLoadResults:
     """Results from temperature-to-load modeling."""
 
@@ -80,7 +86,7 @@ class TemperatureLoadResults:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class LoadForecastingResults:
     """Results from load forecasting."""
 
@@ -91,7 +97,7 @@ class LoadForecastingResults:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class PredictiveMaintenanceResults:
     """Results from predictive maintenance."""
 
@@ -102,7 +108,7 @@ class PredictiveMaintenanceResults:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class OutagePredictionResults:
     """Results from outage prediction."""
 
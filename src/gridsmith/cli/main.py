@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-import yaml
 
 from gridsmith.api.client import GridSmithClient
 from gridsmith.api.config import (
@@ -21,6 +20,7 @@ from gridsmith.api.config import (
     PredictiveMaintenanceConfig,
     TemperatureLoadConfig,
 )
+from gridsmith.core.io import load_yaml
 
 app = typer.Typer(
     name="gridsmith",
@@ -42,13 +42,13 @@ def load_config(config_path: str) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(path) as f:
-        if path.suffix in [".yaml", ".yml"]:
-            return yaml.safe_load(f)
-        elif path.suffix == ".json":
+    if path.suffix in [".yaml", ".yml"]:
+        return load_yaml(path)
+    elif path.suffix == ".json":
+        with open(path) as f:
             return json.load(f)
-        else:
-            raise ValueError(f"Unsupported config format: {path.suffix}")
+    else:
+        raise ValueError(f"Unsupported config format: {path.suffix}")
 
 
 @app.command()
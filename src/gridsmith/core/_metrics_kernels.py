@@ -0,0 +1,72 @@
+"""Numba kernels for metric and anomaly-score computation.
+
+Optional fast paths used by gridsmith.core.eval and gridsmith.core.pipelines
+for large inputs.
+"""
+
+import numpy as np
+
+# Try to import numba with graceful fallback
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    njit = None
+    prange = range
+
+# Minimum array length for which the JIT kernel beats the NumPy path
+NUMBA_MIN_ROWS = 10_000
+
+# The z-score pass is cheaper in NumPy, so the kernel only pays off on longer series
+ZSCORE_NUMBA_MIN_ROWS = 100_000
+
+
+def _reg_kernel_py(a: np.ndarray, p: np.ndarray) -> tuple[float, float, float, float]:
+    """Single pass over actual/predicted computing (mse, mae, mape, rmse).
+
+    MAPE skips zero actuals and is 0.0 when every actual is zero.
+    """
+    n = a.shape[0]
+    s = 0.0
+    sa = 0.0
+    sm = 0.0
+    cnt = 0
+    for i in prange(n):
+        e = a[i] - p[i]
+        s += e * e
+        sa += abs(e)
+        if a[i] != 0.0:
+            sm += abs(e / a[i])
+            cnt += 1
+    mse = s / n
+    mae = sa / n
+    mape = sm / cnt * 100.0 if cnt > 0 else 0.0
+    return mse, mae, mape, np.sqrt(mse)
+
+
+_reg_kernel = (
+    njit(parallel=True, fastmath=True, cache=True)(_reg_kernel_py) if HAS_NUMBA else None
+)
+
+
+def _zscore_kernel_py(
+    x: np.ndarray, mean: float, std: float, threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Single pass computing absolute z-scores and the ``score > threshold`` mask.
+
+    NaN inputs get a NaN score and are not flagged.
+    """
+    n = x.shape[0]
+    score = np.empty(n)
+    mask = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        z = abs((x[i] - mean) / std)
+        score[i] = z
+        mask[i] = z > threshold
+    return score, mask
+
+
+# No fastmath here: it would let the compiler assume NaN-free input
+_zscore_kernel = njit(parallel=True, cache=True)(_zscore_kernel_py) if HAS_NUMBA else None
@@ -4,10 +4,17 @@ This module provides glue code for evaluation metrics.
 Keep only glue code here; delegate actual metric computation to Smith libs.
 """
 
-from typing import Optional
+import math
+from typing import Callable, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+from gridsmith.core._metrics_kernels import NUMBA_MIN_ROWS, _reg_kernel
+
+# Metric inputs: Series are aligned on their index, arrays are used as-is
+ArrayLike = Union[pd.Series, np.ndarray]
+
 # Try to import Smith libraries with graceful fallback
 try:
     import timesmith
@@ -25,10 +32,104 @@ except ImportError:
     HAS_ANOMSMITH = False
     anomsmith = None
 
+# Resolve timesmith metric functions once at import time
+_TIMESMITH_FUNCS = (
+    {name: getattr(timesmith, name, None) for name in ("mae", "rmse", "mape")}
+    if HAS_TIMESMITH
+    else {}
+)
+
+# Resolve the first available anomsmith metrics entry point once at import time
+_ANOMSMITH_COMPUTE: Optional[Callable[..., dict[str, float]]] = (
+    next(
+        (
+            fn
+            for fn in (
+                getattr(anomsmith, "compute_metrics", None),
+                getattr(getattr(anomsmith, "metrics", None), "anomaly", None),
+                getattr(anomsmith, "evaluate", None),
+            )
+            if callable(fn)
+        ),
+        None,
+    )
+    if HAS_ANOMSMITH
+    else None
+)
+
+
+def _to_float_array(values: ArrayLike) -> np.ndarray:
+    """Convert values to a contiguous float64 array, mapping missing values to NaN."""
+    arr = (
+        values.to_numpy(dtype=np.float64, na_value=np.nan)
+        if isinstance(values, pd.Series)
+        else np.asarray(values, dtype=np.float64)
+    )
+    return np.ascontiguousarray(arr)
+
+
+def _regression_arrays(
+    actual: ArrayLike, predicted: ArrayLike
+) -> tuple[np.ndarray, np.ndarray]:
+    """Align inputs and return (actual, predicted) float64 arrays without NaN pairs.
+
+    Series with different indexes are aligned on their shared labels, matching
+    the previous pandas arithmetic that skipped unaligned and missing values.
+    """
+    if (
+        isinstance(actual, pd.Series)
+        and isinstance(predicted, pd.Series)
+        and not actual.index.equals(predicted.index)
+    ):
+        actual, predicted = actual.align(predicted, join="inner")
+
+    a = _to_float_array(actual)
+    p = _to_float_array(predicted)
+    valid = ~(np.isnan(a) | np.isnan(p))
+    return (a, p) if valid.all() else (a[valid], p[valid])
+
+
+def _to_label_array(labels: ArrayLike) -> np.ndarray:
+    """Convert binary (bool or 0/1) labels to an int8 array.
+
+    Raises:
+        ValueError: If any label is not 0/1 (or False/True)
+    """
+    values = labels.to_numpy() if isinstance(labels, pd.Series) else np.asarray(labels)
+    if values.dtype != bool and not ((values == 0) | (values == 1)).all():
+        invalid = np.unique(values[(values != 0) & (values != 1)])[:5]
+        raise ValueError(f"Anomaly labels must be 0/1 or boolean, got {invalid.tolist()}")
+    return values.astype(np.int8, copy=False)
+
+
+# Local regression metrics over (actual, predicted, error, squared error) arrays
+def _mse(a: np.ndarray, p: np.ndarray, err: np.ndarray, sq: np.ndarray) -> float:
+    return float(sq.mean())
+
+
+def _mae(a: np.ndarray, p: np.ndarray, err: np.ndarray, sq: np.ndarray) -> float:
+    return float(np.abs(err).mean())
+
+
+def _rmse(a: np.ndarray, p: np.ndarray, err: np.ndarray, sq: np.ndarray) -> float:
+    return math.sqrt(sq.mean())
+
+
+def _mape(a: np.ndarray, p: np.ndarray, err: np.ndarray, sq: np.ndarray) -> float:
+    nonzero = a != 0
+    return float(np.abs(err[nonzero] / a[nonzero]).mean() * 100) if nonzero.any() else 0.0
+
+
+_METRIC_TABLE = {"mse": _mse, "mae": _mae, "rmse": _rmse, "mape": _mape}
+
+# Position of each metric in the fused kernel's (mse, mae, mape, rmse) output
+_KERNEL_INDEX = {"mse": 0, "mae": 1, "mape": 2, "rmse": 3}
+_EMPTY_STATS = (float("nan"), float("nan"), 0.0, float("nan"))
+
 
 def compute_regression_metrics(
-    actual: pd.Series,
-    predicted: pd.Series,
+    actual: ArrayLike,
+    predicted: ArrayLike,
     metrics: Optional[list[str]] = None,
 ) -> dict[str, float]:
     """Compute regression metrics.
@@ -36,7 +137,7 @@ def compute_regression_metrics(
     Delegates to timesmith when available, otherwise computes locally.
 
     Args:
-        actual: Actual values
+        actual: Actual values (Series are aligned on their index; arrays by position)
         predicted: Predicted values
         metrics: List of metric names to compute (default: ['mse', 'mae', 'rmse', 'mape'])
 
@@ -44,51 +145,39 @@ def compute_regression_metrics(
         Dictionary of metric names to values
     """
     metrics = metrics or ["mse", "mae", "rmse", "mape"]
-    errors = actual - predicted
-    errors_squared = errors**2
-
-    # Metric computation functions (vectorized)
-    metric_computers = {
-        "mse": lambda: float(errors_squared.mean()),
-        "mae": lambda: float(errors.abs().mean()),
-        "rmse": lambda: float(errors_squared.mean() ** 0.5),
-        "mape": lambda: float(
-            (errors[actual != 0] / actual[actual != 0]).abs().mean() * 100
-        )
-        if (actual != 0).any()
-        else 0.0,
-    }
 
-    # Try timesmith first for supported metrics
-    timesmith_metrics = {"mae", "rmse", "mape"}
-    results = {}
-    timesmith_available = HAS_TIMESMITH and timesmith is not None
+    a, p = _regression_arrays(actual, predicted)
 
-    # Map timesmith functions
-    timesmith_funcs = {
-        "mae": getattr(timesmith, "mae", None),
-        "rmse": getattr(timesmith, "rmse", None),
-        "mape": getattr(timesmith, "mape", None),
-    }
+    # Shared inputs: either the fused kernel's statistics or NumPy error arrays
+    stats: Optional[tuple[float, ...]] = None
+    err = sq = None
+    if a.size == 0:
+        stats = _EMPTY_STATS
+    elif _reg_kernel is not None and a.size > NUMBA_MIN_ROWS:
+        stats = tuple(float(v) for v in _reg_kernel(a, p))
+    else:
+        err = a - p
+        sq = err * err
 
     # Compute metrics using timesmith where available
+    results = {}
     for metric in metrics:
-        if metric in timesmith_metrics and timesmith_available:
-            func = timesmith_funcs.get(metric)
-            if func:
-                try:
-                    results[metric] = float(func(actual, predicted))
-                    continue
-                except Exception as e:
-                    # Fallback to local computation if timesmith fails
-                    if metric in metric_computers:
-                        results[metric] = metric_computers[metric]()
-                    else:
-                        raise RuntimeError(f"Timesmith metric computation failed for {metric} and no fallback available: {e}") from e
-                    continue
+        func = _TIMESMITH_FUNCS.get(metric)
+        if func:
+            try:
+                results[metric] = float(func(actual, predicted))
+                continue
+            except Exception as e:
+                # Fallback to local computation if timesmith fails
+                if metric not in _METRIC_TABLE:
+                    raise RuntimeError(f"Timesmith metric computation failed for {metric} and no fallback available: {e}") from e
         # Fallback to local computation
-        if metric in metric_computers:
-            results[metric] = metric_computers[metric]()
+        if metric in _METRIC_TABLE:
+            results[metric] = (
+                stats[_KERNEL_INDEX[metric]]
+                if stats is not None
+                else _METRIC_TABLE[metric](a, p, err, sq)
+            )
 
     return results
 
@@ -115,55 +204,40 @@ def compute_anomaly_metrics(
     metrics = metrics or ["precision", "recall", "f1"]
 
     # Try anomsmith first
-    if HAS_ANOMSMITH and anomsmith is not None:
-        anomsmith_methods = [
-            getattr(anomsmith, "compute_metrics", None),
-            getattr(getattr(anomsmith, "metrics", None), "anomaly", None),
-            getattr(anomsmith, "evaluate", None),
-        ]
-        errors = []
-        for method in anomsmith_methods:
-            if method:
-                try:
-                    return method(actual_labels, predicted_labels, scores, metrics)
-                except Exception as e:
-                    errors.append(e)
-                    continue
-
-        # Fallback: compute locally using sklearn
-        if errors:
-            error_msgs = "; ".join([str(e) for e in errors])
+    if _ANOMSMITH_COMPUTE is not None:
+        try:
+            return _ANOMSMITH_COMPUTE(actual_labels, predicted_labels, scores, metrics)
+        except Exception as e:
             # Log that anomsmith failed but continue with fallback
             import warnings
-            warnings.warn(f"Anomsmith metric computation failed, using fallback: {error_msgs}")
-    from sklearn.metrics import (
-        accuracy_score,
-        f1_score,
-        precision_score,
-        recall_score,
-    )
+            warnings.warn(f"Anomsmith metric computation failed, using fallback: {e}")
+
+    # Binary confusion-matrix counts in one pass: index = 2 * actual + predicted
+    a = _to_label_array(actual_labels)
+    p = _to_label_array(predicted_labels)
+    tn, fp, fn, tp = (int(c) for c in np.bincount((a << 1) | p, minlength=4)[:4])
+    total = tn + fp + fn + tp
+
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
 
     metric_funcs = {
-        "accuracy": lambda: float(accuracy_score(actual_labels, predicted_labels)),
-        "precision": lambda: float(
-            precision_score(actual_labels, predicted_labels, zero_division=0)
-        ),
-        "recall": lambda: float(
-            recall_score(actual_labels, predicted_labels, zero_division=0)
-        ),
-        "f1": lambda: float(
-            f1_score(actual_labels, predicted_labels, zero_division=0)
-        ),
+        "accuracy": lambda: (tp + tn) / total if total else 0.0,
+        "precision": lambda: precision,
+        "recall": lambda: recall,
+        "f1": lambda: 2 * precision * recall / (precision + recall)
+        if precision + recall
+        else 0.0,
     }
 
     return {
-        metric: metric_funcs[metric]() for metric in metrics if metric in metric_funcs
+        metric: float(metric_funcs[metric]()) for metric in metrics if metric in metric_funcs
     }
 
 
 def compute_forecast_metrics(
-    actual: pd.Series,
-    forecast: pd.Series,
+    actual: ArrayLike,
+    forecast: ArrayLike,
     horizons: Optional[pd.Series] = None,
     metrics: Optional[list[str]] = None,
 ) -> dict[str, float]:
@@ -1,57 +1,535 @@
 """I/O utilities for loading and saving data."""
 
+import functools
+import inspect
+import json
+import re
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+import yaml
+
+# Try to import fast YAML/JSON libraries with graceful fallback
+try:
+    import ryml
+
+    HAS_RYML = True
+except ImportError:
+    HAS_RYML = False
+    ryml = None
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+# Plain-scalar resolution matching PyYAML's safe_load (YAML 1.1) for common types
+_YAML_NULLS = {"", "~", "null", "Null", "NULL"}
+_YAML_BOOLS = {
+    **dict.fromkeys(["yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON"], True),
+    **dict.fromkeys(["no", "No", "NO", "false", "False", "FALSE", "off", "Off", "OFF"], False),
+}
+_YAML_INT = re.compile(r"^[-+]?(?:0|[1-9][0-9_]*)$")
+# PyYAML's float forms, minus sexagesimal (left to PyYAML): a leading-dot
+# float needs a digit after the dot and takes no sign
+_YAML_FLOAT = re.compile(
+    r"^(?:[-+]?[0-9][0-9_]*\.[0-9_]*(?:[eE][-+][0-9]+)?"
+    r"|\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?)$"
+)
+_YAML_SPECIAL_FLOATS = {
+    **dict.fromkeys([".inf", ".Inf", ".INF", "+.inf", "+.Inf", "+.INF"], float("inf")),
+    **dict.fromkeys(["-.inf", "-.Inf", "-.INF"], float("-inf")),
+    **dict.fromkeys([".nan", ".NaN", ".NAN"], float("nan")),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _pyyaml_scalar_loader() -> yaml.SafeLoader:
+    """Return a SafeLoader used only for its implicit resolvers and constructors."""
+    return yaml.SafeLoader("")
+
+
+def _resolve_with_pyyaml(text: str) -> Any:
+    """Resolve a plain scalar exactly as yaml.safe_load would."""
+    loader = _pyyaml_scalar_loader()
+    tag = loader.resolve(yaml.ScalarNode, text, (True, False))
+    return loader.yaml_constructors[tag](loader, yaml.ScalarNode(tag, text))
+
+
+def _resolve_plain_scalar(text: str) -> Any:
+    """Convert an unquoted YAML scalar to its Python value.
+
+    Common forms are resolved here; anything else (hex, octal or sexagesimal
+    ints, timestamps, plain strings) goes through PyYAML's resolver.
+    """
+    if text in _YAML_NULLS:
+        return None
+    if text in _YAML_BOOLS:
+        return _YAML_BOOLS[text]
+    if _YAML_INT.match(text):
+        return int(text.replace("_", ""))
+    if text in _YAML_SPECIAL_FLOATS:
+        return _YAML_SPECIAL_FLOATS[text]
+    if _YAML_FLOAT.match(text):
+        try:
+            return float(text.replace("_", ""))
+        except ValueError:
+            pass
+    return _resolve_with_pyyaml(text)
+
+
+def _ryml_node_to_python(tree: Any, node: int) -> Any:
+    """Recursively convert a rapidyaml tree node to dict/list/scalar values."""
+    if tree.is_map(node) or tree.is_seq(node):
+        children = []
+        child = tree.first_child(node)
+        while child != ryml.NONE:
+            children.append(child)
+            child = tree.next_sibling(child)
+        if tree.is_seq(node):
+            return [_ryml_node_to_python(tree, c) for c in children]
+        return {
+            _ryml_scalar(tree.key(c), tree.is_key_quoted(c)): _ryml_node_to_python(tree, c)
+            for c in children
+        }
+    if not tree.has_val(node):
+        return None
+    return _ryml_scalar(tree.val(node), tree.is_val_quoted(node))
+
+
+def _ryml_scalar(value: Optional[memoryview], quoted: bool) -> Any:
+    """Decode a rapidyaml scalar, resolving its type when it is unquoted."""
+    if value is None:
+        return None
+    text = bytes(value).decode()
+    return text if quoted else _resolve_plain_scalar(text)
+
+
+def load_yaml(path: str | Path) -> Any:
+    """Load YAML file.
+
+    Uses rapidyaml when available, otherwise falls back to PyYAML.
+    Plain scalars resolve as with yaml.safe_load on either path.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Parsed YAML content (typically a dictionary)
+    """
+    data = Path(path).read_bytes()
+    if not HAS_RYML or ryml is None:
+        return yaml.safe_load(data)
+
+    tree = ryml.parse_in_arena(data)
+    tree.resolve()  # expand anchors/aliases
+    root = tree.root_id()
+    return _ryml_node_to_python(tree, root) if tree.size() else None
+
+
+# Timestamp formats recognised from the first value, so pandas can use its C parser
+_TIMESTAMP_FORMAT_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (
+        re.compile(
+            r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?"
+            r"(?:Z|[+-]\d{2}:?\d{2})?$"
+        ),
+        "ISO8601",
+    ),
+]
+
+
+def _sniff_timestamp_format(values: pd.Series) -> Optional[str]:
+    """Infer a pd.to_datetime format from the first non-null string value."""
+    first_valid = values.first_valid_index()
+    sample = values.loc[first_valid] if first_valid is not None else None
+    if not isinstance(sample, str):
+        return None
+    return next(
+        (fmt for pattern, fmt in _TIMESTAMP_FORMAT_PATTERNS if pattern.match(sample)),
+        None,
+    )
+
+
+# Smallest magnitude of a present-day epoch value in each unit, largest unit first
+_EPOCH_UNIT_THRESHOLDS: list[tuple[int, str]] = [
+    (10**17, "ns"),
+    (10**14, "us"),
+    (10**11, "ms"),
+    (0, "s"),
+]
+
+
+def _epoch_unit(values: pd.Series) -> str:
+    """Infer the unit of an integer epoch column from its first non-null value."""
+    first_valid = values.first_valid_index()
+    sample = abs(int(values.loc[first_valid])) if first_valid is not None else 0
+    return next(unit for threshold, unit in _EPOCH_UNIT_THRESHOLDS if sample >= threshold)
+
+
+def _parse_timestamps(values: pd.Series, timestamp_format: Optional[str] = None) -> pd.Series:
+    """Parse a column to datetime, passing a known or sniffed format to pandas."""
+    if isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_date(values.dtype.pyarrow_dtype):
+        # Date-only columns inferred by the pyarrow CSV engine
+        return values.astype(pd.ArrowDtype(pa.timestamp("ns")))
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    if timestamp_format is None and pd.api.types.is_integer_dtype(values):
+        # Integer epochs convert with a vectorised unit conversion, no string parsing
+        return pd.to_datetime(values, unit=_epoch_unit(values), cache=True)
+    timestamp_format = timestamp_format or _sniff_timestamp_format(values)
+    return (
+        pd.to_datetime(values, format=timestamp_format, cache=True)
+        if timestamp_format
+        else pd.to_datetime(values, cache=True)
+    )
+
+
+# Uncompressed local CSVs larger than this are memory-mapped for the pyarrow engine
+CSV_MMAP_MIN_BYTES = 100 * 1024 * 1024
+
+
+def _local_file(path: Any) -> Optional[Path]:
+    """Return path as a Path if it names an existing local file, else None."""
+    if not isinstance(path, (str, Path)) or "://" in str(path):
+        return None
+    local = Path(path)
+    return local if local.is_file() else None
+
+
+# pd.read_csv options the pyarrow engine rejects; their presence keeps the C engine
+_PYARROW_CSV_UNSUPPORTED = {
+    "chunksize",
+    "iterator",
+    "nrows",
+    "skipfooter",
+    "converters",
+    "low_memory",
+    "memory_map",
+    "on_bad_lines",
+    "float_precision",
+    "thousands",
+    "dialect",
+    "comment",
+    "delim_whitespace",
+    "quoting",
+    "lineterminator",
+    "dayfirst",
+    "skipinitialspace",
+}
+
+
+def _pyarrow_csv_supported(kwargs: dict[str, Any]) -> bool:
+    """Return True if the pyarrow engine accepts these pd.read_csv options.
+
+    Besides the options in _PYARROW_CSV_UNSUPPORTED, Arrow's tokenizer only
+    splits on a single literal character, so regex or multi-char separators
+    (and ``sep=None`` sniffing) stay on the C/python engines.
+    """
+    if _PYARROW_CSV_UNSUPPORTED.intersection(kwargs):
+        return False
+    for name in ("sep", "delimiter"):
+        if name in kwargs and not (isinstance(kwargs[name], str) and len(kwargs[name]) == 1):
+            return False
+    return True
 
 
 def load_csv(
-    path: str | Path, timestamp_column: Optional[str] = None, **kwargs: Any
+    path: str | Path,
+    timestamp_column: Optional[str] = None,
+    timestamp_format: Optional[str] = None,
+    **kwargs: Any,
 ) -> pd.DataFrame:
     """Load CSV file.
 
     Args:
         path: Path to CSV file
         timestamp_column: Optional column name to parse as datetime
-        **kwargs: Additional arguments passed to pd.read_csv
+        timestamp_format: Optional strftime format (or 'ISO8601') for the
+            timestamp column; sniffed from the first value when omitted
+        **kwargs: Additional arguments passed to pd.read_csv (defaults to
+            engine='pyarrow' and dtype_backend='pyarrow')
 
     Returns:
         DataFrame with loaded data
     """
-    df = pd.read_csv(path, **kwargs)
-    return (
-        df.assign(**{timestamp_column: pd.to_datetime(df[timestamp_column])})
-        if timestamp_column and timestamp_column in df.columns
-        else df
-    )
+    if _pyarrow_csv_supported(kwargs):
+        # Multithreaded Arrow tokenizer with Arrow-backed columns
+        kwargs.setdefault("engine", "pyarrow")
+        kwargs.setdefault("dtype_backend", "pyarrow")
+    local_path = _local_file(path)
+    if (
+        kwargs.get("engine") == "pyarrow"
+        and local_path is not None
+        and local_path.suffix == ".csv"
+        and local_path.stat().st_size > CSV_MMAP_MIN_BYTES
+    ):
+        # Hand the page-cache-backed buffer straight to Arrow's CSV reader
+        with pa.memory_map(str(local_path), "r") as source:
+            df = pd.read_csv(source, **kwargs)
+    else:
+        df = pd.read_csv(path, **kwargs)
+    if timestamp_column and timestamp_column in df.columns:
+        # Assign in place; df.assign would copy every column block
+        df[timestamp_column] = _parse_timestamps(df[timestamp_column], timestamp_format)
+    return df
+
+
+def _arrow_types_mapper(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """Map Arrow types to ArrowDtype, keeping timestamps as datetime64."""
+    return None if pa.types.is_timestamp(arrow_type) else pd.ArrowDtype(arrow_type)
+
+
+def _cast_timestamp_column(table: pa.Table, column: str) -> pa.Table:
+    """Cast a column to timestamp[ns] in Arrow, keeping pandas metadata in sync."""
+    idx = table.schema.get_field_index(column)
+    table = table.set_column(idx, column, table.column(idx).cast(pa.timestamp("ns")))
+
+    # Stored pandas metadata would otherwise cast the column back to its old dtype
+    pandas_meta = table.schema.pandas_metadata
+    if pandas_meta:
+        for col_meta in pandas_meta.get("columns", []):
+            if col_meta.get("field_name") == column:
+                col_meta.update(pandas_type="datetime", numpy_type="datetime64[ns]")
+        table = table.replace_schema_metadata(
+            {**table.schema.metadata, b"pandas": json.dumps(pandas_meta).encode()}
+        )
+    return table
 
 
 def load_parquet(
-    path: str | Path, timestamp_column: Optional[str] = None, **kwargs: Any
+    path: str | Path,
+    timestamp_column: Optional[str] = None,
+    columns: Optional[list[str]] = None,
+    filters: Optional[Any] = None,
+    timestamp_format: Optional[str] = None,
+    **kwargs: Any,
 ) -> pd.DataFrame:
     """Load Parquet file.
 
+    Scans via pyarrow.dataset so column projection and row filters are pushed
+    down to the reader, and converts to Arrow-backed pandas dtypes.
+
     Args:
         path: Path to Parquet file
         timestamp_column: Optional column name to parse as datetime
-        **kwargs: Additional arguments passed to pd.read_parquet
+        columns: Optional list of columns to read
+        filters: Optional row filter (pyarrow Expression or DNF list of tuples)
+        timestamp_format: Optional strftime format (or 'ISO8601') for the
+            timestamp column; when given, parsing is done by pandas
+        **kwargs: Additional arguments passed to pyarrow.dataset.Dataset.to_table
 
     Returns:
         DataFrame with loaded data
     """
-    df = pd.read_parquet(path, **kwargs)
-    return (
-        df.assign(**{timestamp_column: pd.to_datetime(df[timestamp_column])})
-        if timestamp_column and timestamp_column in df.columns
-        else df
+    return _scan_parquet(
+        str(path),
+        timestamp_column=timestamp_column,
+        columns=columns,
+        filters=filters,
+        timestamp_format=timestamp_format,
+        **kwargs,
     )
 
 
+def load_parquet_many(
+    paths: Sequence[str | Path],
+    timestamp_column: Optional[str] = None,
+    columns: Optional[list[str]] = None,
+    filters: Optional[Any] = None,
+    timestamp_format: Optional[str] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Load several Parquet files (e.g. date-partitioned shards) into one DataFrame.
+
+    The files are scanned as a single pyarrow dataset with multithreaded
+    reads, so IO and decompression of different shards overlap.
+
+    Args:
+        paths: Paths to Parquet files sharing a schema
+        timestamp_column: Optional column name to parse as datetime
+        columns: Optional list of columns to read
+        filters: Optional row filter (pyarrow Expression or DNF list of tuples)
+        timestamp_format: Optional strftime format (or 'ISO8601') for the
+            timestamp column; when given, parsing is done by pandas
+        **kwargs: Additional arguments passed to pyarrow.dataset.Dataset.to_table
+
+    Returns:
+        DataFrame with rows from all files, in the order given
+    """
+    kwargs.setdefault("use_threads", True)
+    return _scan_parquet(
+        [str(path) for path in paths],
+        timestamp_column=timestamp_column,
+        columns=columns,
+        filters=filters,
+        timestamp_format=timestamp_format,
+        **kwargs,
+    )
+
+
+def _scan_parquet(
+    source: str | list[str],
+    timestamp_column: Optional[str] = None,
+    columns: Optional[list[str]] = None,
+    filters: Optional[Any] = None,
+    timestamp_format: Optional[str] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Scan parquet file(s) with pyarrow.dataset and convert to pandas."""
+    if filters is not None and not isinstance(filters, pc.Expression):
+        filters = pq.filters_to_expression(filters)
+
+    sources = [source] if isinstance(source, str) else source
+    # Memory-map local files so reads are served from the page cache without a copy
+    filesystem = (
+        pafs.LocalFileSystem(use_mmap=True)
+        if all(_local_file(src) is not None for src in sources)
+        else None
+    )
+    dataset = ds.dataset(source, format="parquet", filesystem=filesystem)
+    if columns is not None:
+        # Keep stored index columns, as pd.read_parquet does when projecting
+        index_columns = (dataset.schema.pandas_metadata or {}).get("index_columns", [])
+        columns = list(columns) + [
+            c for c in index_columns if isinstance(c, str) and c not in columns
+        ]
+    table = dataset.to_table(columns=columns, filter=filters, **kwargs)
+
+    parse_in_pandas = False
+    if (
+        timestamp_column
+        and timestamp_column in table.column_names
+        and not pa.types.is_timestamp(table.schema.field(timestamp_column).type)
+    ):
+        # Arrow would read integer epochs as nanoseconds, so infer the unit in pandas
+        if timestamp_format is not None or pa.types.is_integer(
+            table.schema.field(timestamp_column).type
+        ):
+            parse_in_pandas = True
+        else:
+            try:
+                table = _cast_timestamp_column(table, timestamp_column)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                parse_in_pandas = True
+
+    df = table.to_pandas(self_destruct=True, types_mapper=_arrow_types_mapper)
+    if parse_in_pandas:
+        df[timestamp_column] = _parse_timestamps(df[timestamp_column], timestamp_format)
+    return df
+
+
+# Frames longer than this are written to parquet one row group at a time
+PARQUET_CHUNK_ROWS = 131_072
+
+# df.to_parquet options the chunked writer understands; any other option keeps
+# the single-shot df.to_parquet path so output never depends on frame size
+_PARQUET_WRITER_OPTIONS = frozenset(
+    inspect.signature(pq.ParquetWriter.__init__).parameters
+) - {"self", "where", "schema", "options"}
+
+
+def _can_write_parquet_chunked(kwargs: dict[str, Any]) -> bool:
+    """Return True if every option can be handled by _write_parquet_chunked."""
+    return kwargs.get("engine", "pyarrow") in ("pyarrow", "auto") and all(
+        name in _PARQUET_WRITER_OPTIONS or name in ("index", "engine") for name in kwargs
+    )
+
+
+def _write_parquet_chunked(
+    df: pd.DataFrame,
+    path: Path,
+    chunk_rows: int,
+    index: Optional[bool] = None,
+    engine: str = "pyarrow",
+    **kwargs: Any,
+) -> None:
+    """Stream a DataFrame to parquet in row groups of ``chunk_rows`` rows.
+
+    Only one chunk is converted to Arrow at a time, so peak memory stays close
+    to the size of the DataFrame rather than double it. ``index`` has the same
+    meaning as in ``df.to_parquet``; other options go to ``pq.ParquetWriter``.
+    """
+    preserve_index = index if index is not None else not isinstance(df.index, pd.RangeIndex)
+    schema = pa.Schema.from_pandas(df, preserve_index=index)
+
+    with pq.ParquetWriter(path, schema, **kwargs) as writer:
+        for start in range(0, len(df), chunk_rows):
+            writer.write_table(
+                pa.Table.from_pandas(
+                    df.iloc[start : start + chunk_rows],
+                    schema=schema,
+                    preserve_index=preserve_index,
+                )
+            )
+
+
+# Rows serialized per orjson call when writing a DataFrame as JSON records
+JSON_CHUNK_ROWS = 10_000
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize pandas scalars orjson does not handle, matching df.to_json output."""
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.value // 1_000_000  # epoch milliseconds, as to_json writes
+    if isinstance(obj, pd.Timedelta):
+        return obj.value // 1_000_000
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _write_json_records(df: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame as a JSON array of records with orjson.
+
+    Rows are serialized in chunks of JSON_CHUNK_ROWS and streamed to the file,
+    so large frames never build one giant string.
+    """
+    with open(path, "wb") as f:
+        f.write(b"[")
+        for start in range(0, len(df), JSON_CHUNK_ROWS):
+            records = df.iloc[start : start + JSON_CHUNK_ROWS].to_dict(orient="records")
+            if start:
+                f.write(b",")
+            # Strip the enclosing brackets so chunks join into a single array
+            f.write(
+                orjson.dumps(
+                    records, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY
+                )[1:-1]
+            )
+        f.write(b"]")
+
+
+def _save_parquet(df: pd.DataFrame, path: Path, chunk_rows: int, kwargs: dict[str, Any]) -> None:
+    """Write parquet, streaming row groups when the frame is large enough.
+
+    ``row_group_size`` overrides ``chunk_rows`` on the streaming path, where
+    ParquetWriter has no such option; otherwise it is passed to df.to_parquet.
+    """
+    row_group_size = kwargs.get("row_group_size", chunk_rows)
+    writer_kwargs = {k: v for k, v in kwargs.items() if k != "row_group_size"}
+    if len(df) > row_group_size and _can_write_parquet_chunked(writer_kwargs):
+        _write_parquet_chunked(df, path, row_group_size, **writer_kwargs)
+    else:
+        df.to_parquet(path, **kwargs)
+
+
 def save_dataframe(
     df: pd.DataFrame,
     path: str | Path,
     format: str = "parquet",
+    chunk_rows: int = PARQUET_CHUNK_ROWS,
     **kwargs: Any,
 ) -> None:
     """Save DataFrame to file.
@@ -60,31 +538,66 @@ def save_dataframe(
         df: DataFrame to save
         path: Output path
         format: File format ('parquet', 'csv', or 'json')
+        chunk_rows: Row-group size used to stream large parquet outputs
+            (``row_group_size`` is accepted as an alias)
         **kwargs: Additional arguments passed to save function
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
     save_funcs = {
-        "parquet": lambda: df.to_parquet(path, **kwargs),
+        "parquet": lambda: _save_parquet(df, path, chunk_rows, kwargs),
         "csv": lambda: df.to_csv(path, index=False, **kwargs),
-        "json": lambda: df.to_json(path, orient="records", **kwargs),
+        "json": lambda: (
+            _write_json_records(df, path)
+            if HAS_ORJSON and orjson is not None and not kwargs
+            else df.to_json(path, orient="records", **kwargs)
+        ),
     }
 
     save_func = save_funcs.get(format)
     save_func and save_func()
 
 
-def save_json(data: dict[str, Any], path: str | Path) -> None:
+def _round_floats(obj: Any, ndigits: int = 6) -> Any:
+    """Recursively round floats in dicts/lists/tuples to ``ndigits`` significant digits."""
+    if isinstance(obj, (float, np.floating)):
+        return float(f"{obj:.{ndigits}g}")
+    if isinstance(obj, dict):
+        return {key: _round_floats(value, ndigits) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_round_floats(value, ndigits) for value in obj]
+    return obj
+
+
+def save_json(
+    data: dict[str, Any], path: str | Path, float_digits: Optional[int] = 6
+) -> None:
     """Save dictionary to JSON file.
 
+    Uses orjson when available, which also serializes numpy scalars/arrays.
+
     Args:
         data: Dictionary to save
         path: Output path
+        float_digits: Significant digits kept for float values (None keeps full precision)
     """
-    import json
-
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    if float_digits is not None:
+        data = _round_floats(data, float_digits)
+
+    if HAS_ORJSON and orjson is not None:
+        with open(path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        return
+
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
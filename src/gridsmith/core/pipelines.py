@@ -4,14 +4,20 @@ This module defines chapter pipelines that compose other Smith libraries.
 Core owns orchestration logic but no model math.
 """
 
+import functools
+import importlib
+import math
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from gridsmith.core import DatasetSpec, MetricSpec, SplitSpec
+from gridsmith.core._metrics_kernels import ZSCORE_NUMBA_MIN_ROWS, _zscore_kernel
 from gridsmith.core.contracts import Columns, validate_schema
 from gridsmith.core.eval import (
     compute_anomaly_metrics,
@@ -19,7 +25,7 @@ from gridsmith.core.eval import (
     compute_regression_metrics,
 )
 from gridsmith.core.io import load_csv, load_parquet, save_dataframe, save_json
-from gridsmith.core.plots import plot_anomalies, plot_forecast, plot_time_series
+from gridsmith.core.plots import flush, plot_anomalies, plot_forecast, plot_time_series
 
 # Try to import Smith libraries for pipelines
 try:
@@ -37,6 +43,33 @@ except ImportError:
     timesmith = None
 
 
+@functools.cache
+def _lazy_import(module: str, name: str) -> Any:
+    """Import ``module.name`` on first use and return the cached object afterwards.
+
+    Keeps sklearn and statsmodels off the ``import gridsmith`` path.
+    """
+    return getattr(importlib.import_module(module), name)
+
+
+# Resolve optional-library entry points once at import time
+_ANOM_DETECT_FN = getattr(anomsmith, "detect_anomalies", None)
+_ANOM_DETECTOR_CLS = getattr(anomsmith, "AnomalyDetector", None)
+_TS_FORECAST_FN = getattr(timesmith, "forecast", None)
+_TS_FORECASTER_CLASSES = {
+    name: getattr(timesmith, name)
+    for name in ("ExponentialSmoothingForecaster", "ARIMAForecaster")
+    if hasattr(timesmith, name)
+}
+
+try:
+    import numexpr
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+    numexpr = None
+
+
 @dataclass
 class Config:
     """Base configuration for pipelines."""
@@ -68,19 +101,311 @@ class Results:
         self.metadata = self.metadata or {}
 
 
+# Result tables favour write speed (lz4) and 64k-row groups for read pushdown
+RESULT_TABLE_OPTIONS: dict[str, Any] = {
+    "chunk_rows": 65_536,
+    "compression": "lz4",
+    "use_dictionary": True,
+}
+
+
 # Helper functions with dictionary dispatch and vectorized operations
 
+# Both loaders return Arrow-backed columns (timestamps stay datetime64)
 LOADERS: dict[str, Callable] = {
-    ".csv": lambda path, **kwargs: load_csv(str(path), **kwargs),
-    ".parquet": lambda path, **kwargs: load_parquet(str(path), **kwargs),
+    ".csv": lambda path, columns=None, **kwargs: load_csv(str(path), usecols=columns, **kwargs),
+    ".parquet": lambda path, columns=None, **kwargs: load_parquet(str(path), columns=columns, **kwargs),
 }
 
 
-def _load_dataframe(input_path: Path, timestamp_column: str = Columns.TIMESTAMP) -> pd.DataFrame:
-    """Load dataframe using dictionary dispatch."""
-    loader = LOADERS.get(input_path.suffix)
-    loader or (_ := ValueError(f"Unsupported file format: {input_path.suffix}"))
-    return loader(input_path, timestamp_column=timestamp_column)
+# CSV inputs are mirrored to a parquet file next to them so repeat loads skip CSV parsing
+CSV_SIDECAR_SUFFIX = ".cached.parquet"
+_SIDECAR_SOURCE_KEY = b"gridsmith.source"
+
+
+def _csv_sidecar(input_path: Path) -> Path:
+    """Return the parquet sidecar path for a CSV input."""
+    return input_path.with_name(input_path.name + CSV_SIDECAR_SUFFIX)
+
+
+def _source_stamp(input_path: Path) -> bytes:
+    """Identify a source file version by its mtime and size."""
+    st = input_path.stat()
+    return f"{st.st_mtime_ns}:{st.st_size}".encode()
+
+
+def _sidecar_is_fresh(sidecar: Path, stamp: bytes) -> bool:
+    """Check whether a sidecar was written from the current source version."""
+    try:
+        metadata = pq.read_schema(sidecar).metadata or {}
+    except (OSError, pa.ArrowException):
+        return False
+    return metadata.get(_SIDECAR_SOURCE_KEY) == stamp
+
+
+def _write_sidecar(df: pd.DataFrame, sidecar: Path, stamp: bytes) -> None:
+    """Write a parquet sidecar tagged with the source stamp."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), _SIDECAR_SOURCE_KEY: stamp}
+    )
+    try:
+        pq.write_table(table, sidecar, compression="snappy")
+    except OSError:
+        # Read-only input directory: keep serving from CSV
+        pass
+
+
+def _needed_columns(config: Config, *columns: str) -> Optional[list[str]]:
+    """List the columns a pipeline reads: its dataset spec's plus its own.
+
+    Returns None (read everything) without a dataset spec: pipelines save the
+    whole input frame with their results, so undeclared columns such as a
+    meter id must not be dropped.
+    """
+    spec = config.dataset_spec
+    if spec is None:
+        return None
+    spec_columns = [
+        *spec.required_columns,
+        *spec.optional_columns,
+        *(col for col in (spec.timestamp_column, spec.id_column) if col),
+    ]
+    return list(dict.fromkeys([*spec_columns, *columns])) or None
+
+
+def _project(names: list[str], columns: Optional[list[str]]) -> Optional[list[str]]:
+    """Keep the requested columns that exist, in stored order."""
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return [name for name in names if name in wanted]
+
+
+def _read_dataframe(
+    input_path: Path,
+    timestamp_column: str,
+    columns: Optional[list[str]],
+) -> pd.DataFrame:
+    """Read a CSV or parquet input, going through the CSV's parquet sidecar."""
+    loader = LOADERS[input_path.suffix]
+    if input_path.suffix != ".csv":
+        columns = _project(pq.read_schema(input_path).names, columns)
+        return loader(input_path, timestamp_column=timestamp_column, columns=columns)
+
+    sidecar = _csv_sidecar(input_path)
+    stamp = _source_stamp(input_path)
+    if _sidecar_is_fresh(sidecar, stamp):
+        columns = _project(pq.read_schema(sidecar).names, columns)
+        return LOADERS[".parquet"](sidecar, timestamp_column=timestamp_column, columns=columns)
+
+    # Parse the whole CSV once so the sidecar can serve any later projection
+    df = loader(input_path, timestamp_column=timestamp_column)
+    _write_sidecar(df, sidecar, stamp)
+    columns = _project(list(df.columns), columns)
+    return df if columns is None else df[columns]
+
+
+# Number of loaded input frames kept in memory across pipeline runs
+DATAFRAME_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=DATAFRAME_CACHE_SIZE)
+def _load_dataframe_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    timestamp_column: str,
+    columns: Optional[tuple[str, ...]],
+) -> pd.DataFrame:
+    """Read one version of a file; mtime and size only key the cache."""
+    return _read_dataframe(
+        Path(path), timestamp_column, list(columns) if columns is not None else None
+    )
+
+
+def _load_dataframe(
+    input_path: Path,
+    timestamp_column: str = Columns.TIMESTAMP,
+    columns: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """Load dataframe using dictionary dispatch.
+
+    The first load of a CSV file also writes a parquet sidecar
+    (``<input>.cached.parquet``) keyed on the CSV's mtime and size; later
+    loads read the sidecar while it is fresh. Loaded frames are kept in an
+    LRU cache keyed on path, mtime, size and projection, so running several
+    pipelines on the same unchanged file reads it once.
+
+    ``columns`` lists the columns the caller uses; ones missing from the file
+    are ignored, and parquet reads only scan the rest.
+    """
+    if input_path.suffix not in LOADERS:
+        raise ValueError(f"Unsupported file format: {input_path.suffix}")
+    st = input_path.stat()
+    df = _load_dataframe_cached(
+        str(input_path.resolve()),
+        st.st_mtime_ns,
+        st.st_size,
+        timestamp_column,
+        tuple(columns) if columns is not None else None,
+    )
+    # Pipelines add columns to the frame, so never hand out the cached object
+    return df.copy()
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    """Get a float64 array from a NumPy- or Arrow-backed column, nulls as NaN.
+
+    NumPy float64 columns are returned without a copy.
+    """
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _metric_names(config: Config, metric_type: str) -> list[str]:
+    """List the names of the configured metrics of one type."""
+    return [spec.name for spec in (config.metric_specs or []) if spec.type == metric_type]
+
+
+def _evaluate(
+    expression: str, numpy_fn: Callable[..., np.ndarray], local_dict: dict[str, Any]
+) -> np.ndarray:
+    """Evaluate an elementwise array expression.
+
+    numexpr fuses ``expression`` into one pass without temporary arrays;
+    without it ``numpy_fn``, the same expression written with NumPy ufuncs,
+    is called with ``local_dict`` as keyword arguments.
+    """
+    if HAS_NUMEXPR and numexpr is not None:
+        return numexpr.evaluate(expression, local_dict=local_dict)
+    return numpy_fn(**local_dict)
+
+
+def _seasonal_temperature(
+    base_temp: float, amplitude: float, pi: float, doy: np.ndarray, noise: np.ndarray
+) -> np.ndarray:
+    """NumPy form of the synthetic daily temperature expression."""
+    return base_temp + amplitude * np.sin(2 * pi * doy / 365) + noise
+
+
+def _quadratic_load(
+    base_load: float,
+    coef: float,
+    coef_squared: float,
+    base_temp: float,
+    t: np.ndarray,
+    noise: np.ndarray,
+) -> np.ndarray:
+    """NumPy form of the synthetic temperature-to-load expression."""
+    return base_load + coef * t + coef_squared * (t - base_temp) ** 2 + noise
+
+
+def _seasonal_daily_load(
+    base_load: float,
+    seasonal: float,
+    daily: float,
+    pi: float,
+    doy: np.ndarray,
+    hour: np.ndarray,
+    noise: np.ndarray,
+) -> np.ndarray:
+    """NumPy form of the synthetic hourly load expression."""
+    return (
+        base_load
+        + seasonal * np.sin(2 * pi * doy / 365)
+        + daily * np.sin(2 * pi * hour / 24)
+        + noise
+    )
+
+
+def _synthetic_temperature_load(metadata: dict[str, Any]) -> pd.DataFrame:
+    """Generate daily temperature and load with a quadratic temperature response."""
+    rng = np.random.default_rng(metadata.get("random_state", 42))
+    dates = pd.date_range(
+        start=metadata.get("start_date", "2024-01-01"),
+        periods=metadata.get("days", 365),
+        freq="D",
+    )
+    temp_noise = rng.normal(0, metadata.get("temp_noise_std", 2.0), len(dates))
+    load_noise = rng.normal(0, metadata.get("noise_std", 50.0), len(dates))
+
+    base_temp = metadata.get("base_temp", 20.0)
+    temperature = _evaluate(
+        "base_temp + amplitude * sin(2 * pi * doy / 365) + noise",
+        _seasonal_temperature,
+        {
+            "base_temp": base_temp,
+            "amplitude": metadata.get("temp_amplitude", 10.0),
+            "pi": np.pi,
+            "doy": dates.dayofyear.to_numpy(dtype=np.float64),
+            "noise": temp_noise,
+        },
+    )
+    load = _evaluate(
+        "base_load + coef * t + coef_squared * (t - base_temp) ** 2 + noise",
+        _quadratic_load,
+        {
+            "base_load": metadata.get("base_load", 1000.0),
+            "coef": metadata.get("temp_coef", 10.0),
+            "coef_squared": metadata.get("temp_coef_squared", 0.5),
+            "base_temp": base_temp,
+            "t": temperature,
+            "noise": load_noise,
+        },
+    )
+    return pd.DataFrame({"Date": dates, "Temperature_C": temperature, "Load_MW": load})
+
+
+def _synthetic_hourly_load(metadata: dict[str, Any]) -> pd.DataFrame:
+    """Generate hourly load with seasonal and daily cycles."""
+    rng = np.random.default_rng(metadata.get("random_state", 42))
+    date_rng = pd.date_range(
+        start=metadata.get("start_date", "2024-01-01"),
+        periods=metadata.get("periods", 8760),
+        freq="h",
+    )
+    load = _evaluate(
+        "base_load + seasonal * sin(2 * pi * doy / 365)"
+        " + daily * sin(2 * pi * hour / 24) + noise",
+        _seasonal_daily_load,
+        {
+            "base_load": metadata.get("base_load", 1000.0),
+            "seasonal": metadata.get("seasonal_amplitude", 200.0),
+            "daily": metadata.get("daily_cycle_amplitude", 150.0),
+            "pi": np.pi,
+            "doy": date_rng.dayofyear.to_numpy(dtype=np.float64),
+            "hour": date_rng.hour.to_numpy(dtype=np.float64),
+            "noise": rng.normal(0, metadata.get("noise_std", 20.0), len(date_rng)),
+        },
+    )
+    return pd.DataFrame({Columns.TIMESTAMP: date_rng, "Load_MW": load})
+
+
+def _synthetic_storm_outages(metadata: dict[str, Any]) -> pd.DataFrame:
+    """Generate storm weather and asset features with logistic outage labels."""
+    rng = np.random.default_rng(metadata.get("random_state", 42))
+    samples = metadata.get("samples", 1000)
+    wind_speed = rng.normal(
+        metadata.get("wind_mean", 15.0), metadata.get("wind_std", 8.0), samples
+    )
+    rainfall = rng.normal(
+        metadata.get("rainfall_mean", 50.0), metadata.get("rainfall_std", 20.0), samples
+    )
+    tree_density = rng.uniform(
+        metadata.get("tree_density_min", 0.0), metadata.get("tree_density_max", 1.0), samples
+    )
+    asset_age = rng.uniform(
+        metadata.get("asset_age_min", 0.0), metadata.get("asset_age_max", 50.0), samples
+    )
+    logit = 0.15 * (wind_speed - 25) + 0.03 * (rainfall - 60) + 2 * (tree_density - 0.5)
+    outages = rng.binomial(1, 1 / (1 + np.exp(-logit)))
+    return pd.DataFrame({
+        "WindSpeed_mps": wind_speed,
+        "Rainfall_mm": rainfall,
+        "TreeDensity": tree_density,
+        "AssetAge_years": asset_age,
+        "Outage": outages,
+    })
 
 
 def _find_column(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
@@ -100,164 +425,191 @@ def _normalize_forecast_column(forecast_df: pd.DataFrame, value_column: str) ->
 
 
 def _try_anomsmith_detection(df: pd.DataFrame, column: str) -> pd.DataFrame:
-    """Try anomsmith detection using strategy pattern."""
-    (HAS_ANOMSMITH and anomsmith) or (lambda: None)()
-    (HAS_ANOMSMITH and anomsmith) or (lambda: df)()
-    (HAS_ANOMSMITH and anomsmith) or (lambda: None)()
-
-    strategies = [
-        lambda: (
-            (result := getattr(anomsmith, "detect_anomalies", lambda _: None)(df[column])) and
-            isinstance(result, dict) and
-            df.assign(
-                **{
-                    Columns.ANOMALY_SCORE: result.get("scores", result.get("score")),
-                    Columns.IS_ANOMALY: result.get("labels", result.get("anomalies")),
-                }
-            )
-        ),
-        lambda: (
-            hasattr(anomsmith, "AnomalyDetector") and
-            (detector := anomsmith.AnomalyDetector()) and
-            detector.fit(df[[column]]) and
-            (predictions := detector.predict(df[[column]])) and
-            df.assign(
-                **{
-                    Columns.IS_ANOMALY: predictions == -1,
-                    Columns.ANOMALY_SCORE: getattr(detector, "score_samples", lambda _: None)(df[[column]])
-                    if hasattr(detector, "score_samples") else None,
-                }
-            )
-        ),
-    ]
+    """Try anomsmith detection, returning ``df`` unchanged when it is unavailable.
 
+    Uses ``anomsmith.detect_anomalies`` first, then ``anomsmith.AnomalyDetector``.
+    """
     errors = []
-    for strategy in strategies:
+    if _ANOM_DETECT_FN is not None:
+        try:
+            result = _ANOM_DETECT_FN(df[column])
+            if isinstance(result, dict):
+                return df.assign(
+                    **{
+                        Columns.ANOMALY_SCORE: result.get("scores", result.get("score")),
+                        Columns.IS_ANOMALY: result.get("labels", result.get("anomalies")),
+                    }
+                )
+        except Exception as e:
+            errors.append(e)
+
+    if _ANOM_DETECTOR_CLS is not None:
         try:
-            result_df = strategy()
-            if result_df is not None and Columns.IS_ANOMALY in result_df.columns:
-                return result_df
+            features = df[[column]]
+            detector = _ANOM_DETECTOR_CLS()
+            detector.fit(features)
+            scores = (
+                detector.score_samples(features) if hasattr(detector, "score_samples") else None
+            )
+            # sklearn-style detectors flag samples scoring below offset_, so the
+            # labels follow from the scores without another predict pass
+            offset = getattr(detector, "offset_", None)
+            labels = (
+                scores < offset
+                if scores is not None and offset is not None
+                else detector.predict(features) == -1
+            )
+            return df.assign(**{Columns.IS_ANOMALY: labels, Columns.ANOMALY_SCORE: scores})
         except Exception as e:
             errors.append(e)
-            continue
+
     if errors:
         error_msgs = "; ".join([str(e) for e in errors])
         raise RuntimeError(f"All anomsmith detection strategies failed: {error_msgs}") from errors[0]
     return df
 
 
+def _split_positions(
+    n: int, test_size: float, seed: Optional[int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Shuffle row positions and split them into train and test positions.
+
+    As with sklearn's train_test_split, an integer ``test_size`` is the number
+    of test rows and a float is a fraction: the test set gets
+    ``ceil(n * test_size)`` rows.
+
+    Raises:
+        ValueError: If ``test_size`` leaves no train or no test rows
+    """
+    if isinstance(test_size, (int, np.integer)):
+        n_test = int(test_size)
+    else:
+        if not 0.0 < test_size < 1.0:
+            raise ValueError(f"test_size={test_size} should be in (0, 1) or an integer row count")
+        n_test = math.ceil(n * test_size)
+    if not 0 < n_test < n:
+        raise ValueError(f"test_size={test_size} leaves no train or test rows for n={n} rows")
+
+    perm = np.random.default_rng(seed).permutation(n)
+    cut = n - n_test
+    return perm[:cut], perm[cut:]
+
+
 def _compute_zscore_anomalies(df: pd.DataFrame, column: str, config: Config) -> pd.DataFrame:
-    """Compute Z-score anomalies with vectorized operations."""
-    from sklearn.model_selection import train_test_split
+    """Compute Z-score anomalies with vectorized operations.
 
+    With a split spec and ground truth, mean and std come from the training
+    split only; otherwise from the whole column. Long series are scored by
+    a parallel Numba kernel when numba is installed. The score and flag
+    columns are added to ``df`` in place, and ``df`` is returned.
+    """
     split_spec = config.split_spec
-    has_ground_truth = "ground_truth" in df.columns
-
-    # Vectorized computation paths using dictionary dispatch
-    compute_paths = {
-        (True, True): lambda: (
-            (train_idx, test_idx := train_test_split(
-                df.index,
-                test_size=getattr(split_spec, "test_ratio", None) or 0.2,
-                random_state=config.metadata.get("random_state", 42),
-                shuffle=True,
-            )) and
-            (train_df := df.loc[train_idx]) and
-            (mean := train_df[column].mean()) and
-            (std := train_df[column].std()) and
-            df.assign(**{
-                Columns.ANOMALY_SCORE: ((df[column] - mean) / std).abs(),
-            }).assign(**{
-                Columns.IS_ANOMALY: lambda x: x[Columns.ANOMALY_SCORE] > 2.0
-            })
-        ),
-        (True, False): lambda: (
-            (mean := df[column].mean()) and
-            (std := df[column].std()) and
-            df.assign(**{
-                Columns.ANOMALY_SCORE: ((df[column] - mean) / std).abs(),
-                Columns.IS_ANOMALY: lambda x: ((df[column] - mean) / std).abs() > 2.0,
-            })
-        ),
-    }
+    values = _float_values(df[column])
+
+    fit_values = values
+    if split_spec and "ground_truth" in df.columns:
+        train_pos, _ = _split_positions(
+            len(df),
+            getattr(split_spec, "test_ratio", None) or 0.2,
+            config.metadata.get("random_state", 42),
+        )
+        fit_values = values[train_pos]
+
+    mean = np.nanmean(fit_values)
+    std = np.nanstd(fit_values, ddof=1)
+
+    if _zscore_kernel is not None and len(values) >= ZSCORE_NUMBA_MIN_ROWS:
+        z, mask = _zscore_kernel(values, mean, std, 2.0)
+    else:
+        # One z-score pass; the anomaly mask reuses it
+        z = np.abs((values - mean) / std)
+        mask = z > 2.0
+    df[Columns.ANOMALY_SCORE] = z
+    df[Columns.IS_ANOMALY] = mask
+    return df
 
-    path_key = (bool(split_spec), has_ground_truth)
-    compute_func = compute_paths.get(path_key)
-    return compute_func() if compute_func else df
+
+def _append_forecast(
+    df: pd.DataFrame, timestamp_column: str, forecast: np.ndarray
+) -> pd.DataFrame:
+    """Append one hourly row per forecast value after the last timestamp.
+
+    The frame is reindexed to its final length in one allocation and the
+    new rows are filled in place, instead of concatenating a second frame.
+    Other columns are missing in the new rows.
+    """
+    n, horizon = len(df), len(forecast)
+    out = df.reset_index(drop=True).reindex(pd.RangeIndex(n + horizon))
+    if Columns.FORECAST not in out.columns:
+        out[Columns.FORECAST] = np.nan
+    out.iloc[n:, out.columns.get_loc(timestamp_column)] = pd.date_range(
+        start=df[timestamp_column].max() + pd.Timedelta(hours=1),
+        periods=horizon,
+        freq="h",
+    )
+    out.iloc[n:, out.columns.get_loc(Columns.FORECAST)] = forecast
+    return out
+
+
+def _fit_forecaster(
+    fc_class: type,
+    ts_series: pd.Series,
+    data_subset: pd.DataFrame,
+    timestamp_column: str,
+    value_column: str,
+    horizon: int,
+) -> Any:
+    """Fit a timesmith forecaster class and predict ``horizon`` steps."""
+    forecaster = fc_class()
+    try:
+        forecaster.fit(y=ts_series)
+    except TypeError:
+        forecaster.fit(**{timestamp_column: timestamp_column, "y": data_subset[value_column]})
+    return forecaster.predict(horizon=horizon)
 
 
 def _try_timesmith_forecast(
     df: pd.DataFrame, value_column: str, timestamp_column: str, horizon: int, forecaster_type: Optional[str] = None
 ) -> tuple[pd.DataFrame, bool]:
-    """Try timesmith forecasting using strategy pattern."""
-    (HAS_TIMESMITH and timesmith) or (lambda: None)()
-    (HAS_TIMESMITH and timesmith) or (lambda: (df, False))()
-    (HAS_TIMESMITH and timesmith) or (lambda: None)()
+    """Try timesmith forecasting, returning ``(df, False)`` when it is unavailable.
+
+    Uses ``timesmith.forecast`` first, then the forecaster classes.
+    """
+    fc_names = [forecaster_type] if forecaster_type else list(_TS_FORECASTER_CLASSES)
+    fc_classes = [
+        _TS_FORECASTER_CLASSES.get(name) or getattr(timesmith, name, None) for name in fc_names
+    ]
+    fc_classes = [fc_class for fc_class in fc_classes if fc_class is not None]
+    if _TS_FORECAST_FN is None and not fc_classes:
+        return df, False
 
     data_subset = df[[timestamp_column, value_column]]
     ts_series = data_subset.set_index(timestamp_column)[value_column]
 
-    strategies = []
-
-    # Strategy 1: Function-based API
-    hasattr(timesmith, "forecast") and strategies.append(
-        lambda: timesmith.forecast(
-            data_subset, timestamp_column=timestamp_column, value_column=value_column, horizon=horizon
+    strategies: list[Callable[[], Any]] = []
+    if _TS_FORECAST_FN is not None:
+        strategies.append(
+            lambda: _TS_FORECAST_FN(
+                data_subset, timestamp_column=timestamp_column, value_column=value_column, horizon=horizon
+            )
         )
-    )
-
-    # Strategy 2: Specific forecaster classes
-    forecaster_classes = [forecaster_type] if forecaster_type else ["ExponentialSmoothingForecaster", "ARIMAForecaster"]
-    for fc_name in forecaster_classes:
-        fc_class = getattr(timesmith, fc_name, None)
-        fc_class and strategies.append(
-            (lambda fc=fc_class: lambda: (
-                (forecaster := fc()) and
-                next(
-                    (forecaster for params in [
-                        {"y": ts_series},
-                        {timestamp_column: timestamp_column, "y": data_subset[value_column]},
-                    ] if (lambda: forecaster.fit(**params) or True)()),
-                    None
-                ) and
-                forecaster.predict(horizon=horizon)
-            ))()
+    strategies.extend(
+        functools.partial(
+            _fit_forecaster, fc_class, ts_series, data_subset, timestamp_column, value_column, horizon
         )
+        for fc_class in fc_classes
+    )
 
-    # Try strategies
     errors = []
     for strategy in strategies:
         try:
             forecasts = strategy()
-            forecast_handlers = {
-                pd.DataFrame: lambda: (
-                    _normalize_forecast_column(forecasts, value_column), True
-                ) if not forecasts.empty else (df, False),
-                pd.Series: lambda: (
-                    pd.concat([
-                        df,
-                        pd.DataFrame({
-                            timestamp_column: pd.date_range(
-                                start=df[timestamp_column].max() + pd.Timedelta(hours=1),
-                                periods=horizon,
-                                freq="h",
-                            ),
-                            Columns.FORECAST: forecasts.values,
-                        })
-                    ], ignore_index=True),
-                    True
-                ),
-            }
-            handler = next(
-                (h for t, h in forecast_handlers.items() if isinstance(forecasts, t)),
-                lambda: (df, False)
-            )
-            result_df, success = handler()
-            if success:
-                return result_df, True
+            if isinstance(forecasts, pd.DataFrame) and not forecasts.empty:
+                return _normalize_forecast_column(forecasts, value_column), True
+            if isinstance(forecasts, pd.Series):
+                return _append_forecast(df, timestamp_column, forecasts.to_numpy()), True
         except Exception as e:
             errors.append(e)
-            continue
     if errors:
         error_msgs = "; ".join([str(e) for e in errors])
         raise RuntimeError(f"All timesmith forecast strategies failed: {error_msgs}") from errors[0]
@@ -271,37 +623,43 @@ def run_ami_anomaly_pipeline(config: Config) -> Results:
 
     # Load data using dictionary dispatch
     input_path = Path(config.input_path)
-    df = _load_dataframe(input_path, Columns.TIMESTAMP)
+    columns = _needed_columns(
+        config,
+        Columns.TIMESTAMP,
+        Columns.CONSUMPTION,
+        "ground_truth",
+        Columns.ANOMALY_SCORE,
+        Columns.IS_ANOMALY,
+    )
+    df = _load_dataframe(input_path, Columns.TIMESTAMP, columns)
 
     # Validate schema
     config.dataset_spec and validate_schema(set(df.columns), config.dataset_spec)
 
-    # Anomaly detection - vectorized path
-    Columns.ANOMALY_SCORE not in df.columns and (
-        Columns.CONSUMPTION not in df.columns and
-        (_ := ValueError(f"Missing required column: {Columns.CONSUMPTION}"))
-    ) or (
-        (df := _try_anomsmith_detection(df, Columns.CONSUMPTION)) and
-        Columns.ANOMALY_SCORE not in df.columns and
-        (df := _compute_zscore_anomalies(df, Columns.CONSUMPTION, config))
-    )
-
-    # Compute metrics - vectorized with dictionary comprehension
-    test_df = None  # Will be set if split exists
-    metrics = {
-        metric_spec.name: compute_anomaly_metrics(
-            (test_df if test_df is not None and isinstance(test_df, pd.DataFrame) else df)["ground_truth"],
-            (test_df if test_df is not None and isinstance(test_df, pd.DataFrame) else df)[Columns.IS_ANOMALY],
-            (test_df if test_df is not None and isinstance(test_df, pd.DataFrame) else df).get(Columns.ANOMALY_SCORE),
-            metrics=[metric_spec.name],
-        )[metric_spec.name]
-        for metric_spec in (config.metric_specs or [])
-        if metric_spec.type == "anomaly" and "ground_truth" in df.columns
-    }
+    # Anomaly detection: anomsmith when available, else z-scores (one assign either way)
+    if Columns.ANOMALY_SCORE not in df.columns:
+        if Columns.CONSUMPTION not in df.columns:
+            raise ValueError(f"Missing required column: {Columns.CONSUMPTION}")
+        df = _try_anomsmith_detection(df, Columns.CONSUMPTION)
+        if Columns.ANOMALY_SCORE not in df.columns:
+            df = _compute_zscore_anomalies(df, Columns.CONSUMPTION, config)
+
+    # Compute all requested metrics in one batched call
+    metric_names = _metric_names(config, "anomaly")
+    metrics = (
+        compute_anomaly_metrics(
+            df["ground_truth"],
+            df[Columns.IS_ANOMALY],
+            df.get(Columns.ANOMALY_SCORE),
+            metrics=metric_names,
+        )
+        if metric_names and "ground_truth" in df.columns
+        else {}
+    )
 
     # Save outputs
     results_table_path = output_dir / "tables" / "anomaly_results.parquet"
-    save_dataframe(df, results_table_path, format="parquet")
+    save_dataframe(df, results_table_path, format="parquet", **RESULT_TABLE_OPTIONS)
     tables = {"anomaly_results": str(results_table_path)}
 
     plot_info = plot_anomalies(
@@ -331,7 +689,7 @@ def run_outage_event_pipeline(config: Config) -> Results:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     input_path = Path(config.input_path)
-    df = _load_dataframe(input_path, Columns.TIMESTAMP)
+    df = _load_dataframe(input_path, Columns.TIMESTAMP, _needed_columns(config))
     config.dataset_spec and validate_schema(set(df.columns), config.dataset_spec)
 
     metrics: dict[str, float] = {}
@@ -355,31 +713,42 @@ def run_transformer_forecast_pipeline(config: Config) -> Results:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     input_path = Path(config.input_path)
-    df = _load_dataframe(input_path, Columns.TIMESTAMP)
+    columns = _needed_columns(
+        config,
+        Columns.TIMESTAMP,
+        Columns.CONSUMPTION,
+        Columns.DEMAND,
+        Columns.POWER,
+        Columns.ACTUAL,
+        Columns.FORECAST,
+    )
+    df = _load_dataframe(input_path, Columns.TIMESTAMP, columns)
     config.dataset_spec and validate_schema(set(df.columns), config.dataset_spec)
 
     value_column = _find_column(df, [Columns.CONSUMPTION, Columns.DEMAND, Columns.POWER])
-    value_column or (_ := ValueError("No value column found for forecasting"))
+    if value_column is None:
+        raise ValueError("No value column found for forecasting")
 
     horizon = config.metadata.get("horizon", 24)
     forecast_df, timesmith_success = _try_timesmith_forecast(
         df, value_column, Columns.TIMESTAMP, horizon, "ExponentialSmoothingForecaster"
     )
 
-    metrics = {
-        metric_spec.name: compute_forecast_metrics(
+    metric_names = _metric_names(config, "forecast")
+    metrics = (
+        compute_forecast_metrics(
             forecast_df[Columns.ACTUAL],
             forecast_df[Columns.FORECAST],
-            metrics=[metric_spec.name],
-        )[metric_spec.name]
-        for metric_spec in (config.metric_specs or [])
-        if metric_spec.type == "forecast"
+            metrics=metric_names,
+        )
+        if metric_names
         and Columns.ACTUAL in forecast_df.columns
         and Columns.FORECAST in forecast_df.columns
-    }
+        else {}
+    )
 
     results_table_path = output_dir / "tables" / "forecast_results.parquet"
-    save_dataframe(forecast_df, results_table_path, format="parquet")
+    save_dataframe(forecast_df, results_table_path, format="parquet", **RESULT_TABLE_OPTIONS)
     tables = {"forecast_results": str(results_table_path)}
 
     plot_info = (
@@ -394,6 +763,7 @@ def run_transformer_forecast_pipeline(config: Config) -> Results:
         )
     )
     figures = {"forecast_plot": plot_info["output_path"]} if plot_info and "output_path" in plot_info else {}
+    flush()  # figures saved in the background must exist before returning
 
     save_json(metrics, output_dir / "metrics.json")
 
@@ -416,83 +786,64 @@ def run_temperature_load_pipeline(config: Config) -> Results:
 
     # Load or generate data using ternary expression
     df = (
-        _load_dataframe(input_path, "Date")
-        if input_path.exists() and input_path.suffix in [".csv", ".parquet"]
-        else (
-            (np.random.seed(metadata.get("random_state", 42))) and
-            (dates := pd.date_range(
-                start=metadata.get("start_date", "2024-01-01"),
-                periods=metadata.get("days", 365),
-                freq="D",
-            )) and
-            (temperature := (
-                metadata.get("base_temp", 20.0)
-                + metadata.get("temp_amplitude", 10.0) * np.sin(2 * np.pi * dates.dayofyear / 365)
-                + np.random.normal(0, metadata.get("temp_noise_std", 2.0), len(dates))
-            )) and
-            (load := (
-                metadata.get("base_load", 1000.0)
-                + metadata.get("temp_coef", 10.0) * temperature
-                + metadata.get("temp_coef_squared", 0.5) * (temperature - metadata.get("base_temp", 20.0)) ** 2
-                + np.random.normal(0, metadata.get("noise_std", 50.0), len(dates))
-            )) and
-            pd.DataFrame({"Date": dates, "Temperature_C": temperature, "Load_MW": load})
+        _load_dataframe(
+            input_path, "Date", _needed_columns(config, "Date", "Temperature_C", "Load_MW")
         )
+        if input_path.exists() and input_path.suffix in [".csv", ".parquet"]
+        else _synthetic_temperature_load(metadata)
     )
 
     config.dataset_spec and validate_schema(set(df.columns), config.dataset_spec)
 
-    from sklearn.linear_model import LinearRegression
-    from sklearn.model_selection import train_test_split
-
-    test_size = metadata.get("test_size", 0.2)
-    train_indices, test_indices = train_test_split(
-        df.index,
-        test_size=test_size,
-        random_state=metadata.get("random_state", 42),
-        shuffle=True,
+    train_pos, test_pos = _split_positions(
+        len(df), metadata.get("test_size", 0.2), metadata.get("random_state", 42)
     )
 
-    X_train = df.loc[train_indices, ["Temperature_C"]].values
-    y_train = df.loc[train_indices, "Load_MW"].values
-    X_test = df.loc[test_indices, ["Temperature_C"]].values
-    y_test = df.loc[test_indices, "Load_MW"].values
+    # Convert each column to one contiguous float64 array, then split by position
+    x = np.ascontiguousarray(_float_values(df["Temperature_C"]))
+    y = np.ascontiguousarray(_float_values(df["Load_MW"]))
+    x_train, x_test = x[train_pos], x[test_pos]
+    y_train, y_test = y[train_pos], y[test_pos]
 
-    model = LinearRegression()
-    model.fit(X_train, y_train)
+    # Univariate least squares in closed form
+    x_centered = x_train - x_train.mean()
+    slope = float(x_centered @ (y_train - y_train.mean()) / (x_centered @ x_centered))
+    intercept = float(y_train.mean() - slope * x_train.mean())
 
-    y_train_pred = model.predict(X_train)
-    y_test_pred = model.predict(X_test)
+    y_train_pred = intercept + slope * x_train
+    y_test_pred = intercept + slope * x_test
 
-    df = df.assign(predicted_load=0.0)
-    df.loc[train_indices, "predicted_load"] = y_train_pred
-    df.loc[test_indices, "predicted_load"] = y_test_pred
-    df = df.assign(residual=lambda x: x["Load_MW"] - x["predicted_load"])
+    # Build both output columns in NumPy and attach them with a single assign
+    predicted = np.empty(len(df))
+    predicted[train_pos] = y_train_pred
+    predicted[test_pos] = y_test_pred
+    df = df.assign(predicted_load=predicted, residual=y - predicted)
 
-    # Compute metrics using dictionary comprehension
+    # Compute all requested metrics in one batched call
+    metric_names = _metric_names(config, "regression")
     metrics = (
-        {
-            metric_spec.name: compute_regression_metrics(
-                pd.Series(y_test),
-                pd.Series(y_test_pred),
-                metrics=[metric_spec.name],
-            )[metric_spec.name]
-            for metric_spec in (config.metric_specs or [])
-            if metric_spec.type == "regression"
-        }
+        (
+            compute_regression_metrics(
+                y_test,
+                y_test_pred,
+                metrics=metric_names,
+            )
+            if metric_names
+            else {}
+        )
         if config.metric_specs
-        else (
-            (regression_metrics := compute_regression_metrics(
-                pd.Series(y_test),
-                pd.Series(y_test_pred),
+        else {
+            **compute_regression_metrics(
+                y_test,
+                y_test_pred,
                 metrics=["mse", "r2", "mae"],
-            )) and
-            {**regression_metrics, "coefficient": float(model.coef_[0])}
-        )
+            ),
+            "coefficient": slope,
+        }
     )
 
     results_table_path = output_dir / "tables" / "temperature_load_results.parquet"
-    save_dataframe(df, results_table_path, format="parquet")
+    save_dataframe(df, results_table_path, format="parquet", **RESULT_TABLE_OPTIONS)
     tables = {"temperature_load_results": str(results_table_path)}
 
     plot_info_1 = plot_time_series(
@@ -520,6 +871,7 @@ def run_temperature_load_pipeline(config: Config) -> Results:
             "predictions_plot": plot_info_2.get("output_path"),
         }.items() if v
     }
+    flush()  # figures saved in the background must exist before returning
 
     save_json(metrics, output_dir / "metrics.json")
 
@@ -531,7 +883,7 @@ def run_temperature_load_pipeline(config: Config) -> Results:
         metadata={
             "pipeline": "temperature_load",
             "input_shape": df.shape,
-            "model_coefficient": float(model.coef_[0]),
+            "model_coefficient": slope,
         },
     )
 
@@ -546,87 +898,70 @@ def run_load_forecasting_pipeline(config: Config) -> Results:
 
     # Load or generate data
     df = (
-        _load_dataframe(input_path, Columns.TIMESTAMP)
-        if input_path.exists() and input_path.suffix in [".csv", ".parquet"]
-        else (
-            (np.random.seed(metadata.get("random_state", 42))) and
-            (date_rng := pd.date_range(
-                start=metadata.get("start_date", "2024-01-01"),
-                periods=metadata.get("periods", 8760),
-                freq="h",
-            )) and
-            (load := (
-                metadata.get("base_load", 1000.0)
-                + metadata.get("seasonal_amplitude", 200.0) * np.sin(2 * np.pi * date_rng.dayofyear / 365)
-                + metadata.get("daily_cycle_amplitude", 150.0) * np.sin(2 * np.pi * date_rng.hour / 24)
-                + np.random.normal(0, metadata.get("noise_std", 20.0), len(date_rng))
-            )) and
-            pd.DataFrame({Columns.TIMESTAMP: date_rng, "Load_MW": load})
+        _load_dataframe(
+            input_path,
+            Columns.TIMESTAMP,
+            _needed_columns(
+                config,
+                Columns.TIMESTAMP,
+                "Load_MW",
+                "load",
+                Columns.DEMAND,
+                Columns.CONSUMPTION,
+                Columns.ACTUAL,
+                Columns.FORECAST,
+            ),
         )
+        if input_path.exists() and input_path.suffix in [".csv", ".parquet"]
+        else _synthetic_hourly_load(metadata)
     )
 
     config.dataset_spec and validate_schema(set(df.columns), config.dataset_spec)
 
     load_column = _find_column(df, ["Load_MW", "load", Columns.DEMAND, Columns.CONSUMPTION])
-    load_column or (_ := ValueError(
-        "No load column found. Expected: Load_MW, load, demand, or consumption"
-    ))
+    if load_column is None:
+        raise ValueError("No load column found. Expected: Load_MW, load, demand, or consumption")
 
     forecast_horizon = metadata.get("forecast_horizon", 24)
     forecast_df, timesmith_success = _try_timesmith_forecast(
         df, load_column, Columns.TIMESTAMP, forecast_horizon, "ARIMAForecaster"
     )
 
-    # Fallback to ARIMA using vectorized operations
-    (not timesmith_success and Columns.FORECAST not in forecast_df.columns and load_column in forecast_df.columns) and (
-        (lambda df_inner=forecast_df, col=load_column, horizon=forecast_horizon, meta=metadata: (
-            (lambda: __import__("statsmodels.tsa.arima.model", fromlist=["ARIMA"]))() and
-            (ARIMA := __import__("statsmodels.tsa.arima.model", fromlist=["ARIMA"]).ARIMA) and
-            (ts := df_inner.set_index(Columns.TIMESTAMP)[col]) and
-            (arima_order := tuple(meta.get("arima_order", (1, 1, 1)))) and
-            (model := ARIMA(ts, order=arima_order)) and
-            (fit := model.fit()) and
-            (forecast := fit.forecast(steps=horizon)) and
-            (forecast_df := pd.concat([
-                df_inner,
-                pd.DataFrame({
-                    Columns.TIMESTAMP: pd.date_range(
-                        start=df_inner[Columns.TIMESTAMP].max() + pd.Timedelta(hours=1),
-                        periods=horizon,
-                        freq="h",
-                    ),
-                    Columns.FORECAST: forecast.values,
-                })
-            ], ignore_index=True))
-        )()) and
-        (forecast_df := forecast_df)
-    )
-
-    # Compute metrics using dictionary comprehension
+    # Fallback to statsmodels ARIMA
+    if (
+        not timesmith_success
+        and Columns.FORECAST not in forecast_df.columns
+        and load_column in forecast_df.columns
+    ):
+        arima_cls = _lazy_import("statsmodels.tsa.arima.model", "ARIMA")
+        ts = forecast_df.set_index(Columns.TIMESTAMP)[load_column]
+        fit = arima_cls(ts, order=tuple(metadata.get("arima_order", (1, 1, 1)))).fit()
+        forecast = fit.forecast(steps=forecast_horizon)
+        forecast_df = _append_forecast(forecast_df, Columns.TIMESTAMP, forecast.to_numpy())
+
+    # Compute all requested metrics in one batched call
+    metric_names = _metric_names(config, "forecast")
     metrics = (
-        {
-            metric_spec.name: compute_forecast_metrics(
+        (
+            compute_forecast_metrics(
                 forecast_df[Columns.ACTUAL],
                 forecast_df[Columns.FORECAST],
-                metrics=[metric_spec.name],
-            )[metric_spec.name]
-            for metric_spec in (config.metric_specs or [])
-            if metric_spec.type == "forecast"
-            and Columns.ACTUAL in forecast_df.columns
-            and Columns.FORECAST in forecast_df.columns
-        }
-        if config.metric_specs and Columns.ACTUAL in forecast_df.columns and Columns.FORECAST in forecast_df.columns
-        else (
-            Columns.FORECAST in forecast_df.columns and load_column in forecast_df.columns and
-            compute_forecast_metrics(
-                forecast_df[load_column].iloc[:-forecast_horizon] if len(forecast_df) > forecast_horizon else forecast_df[load_column],
-                forecast_df[Columns.FORECAST].iloc[-forecast_horizon:],
+                metrics=metric_names,
             )
-        ) or {}
+            if metric_names
+            else {}
+        )
+        if config.metric_specs and Columns.ACTUAL in forecast_df.columns and Columns.FORECAST in forecast_df.columns
+        else compute_forecast_metrics(
+            forecast_df[load_column].iloc[:-forecast_horizon] if len(forecast_df) > forecast_horizon else forecast_df[load_column],
+            forecast_df[Columns.FORECAST].iloc[-forecast_horizon:],
+        )
+        if Columns.FORECAST in forecast_df.columns and load_column in forecast_df.columns
+        else {}
     )
 
     results_table_path = output_dir / "tables" / "load_forecast_results.parquet"
-    save_dataframe(forecast_df, results_table_path, format="parquet")
+    save_dataframe(forecast_df, results_table_path, format="parquet", **RESULT_TABLE_OPTIONS)
     tables = {"load_forecast_results": str(results_table_path)}
 
     plot_info = (
@@ -641,6 +976,7 @@ def run_load_forecasting_pipeline(config: Config) -> Results:
         )
     )
     figures = {"load_forecast_plot": plot_info["output_path"]} if plot_info and "output_path" in plot_info else {}
+    flush()  # figures saved in the background must exist before returning
 
     save_json(metrics, output_dir / "metrics.json")
 
@@ -660,68 +996,59 @@ def run_predictive_maintenance_pipeline(config: Config) -> Results:
 
     input_path = Path(config.input_path)
     df = _load_dataframe(input_path, Columns.TIMESTAMP)
+    # Work in positional form: a named index (e.g. a stored timestamp) becomes a column once
+    if df.index.name and df.index.name != "index":
+        df = df.reset_index()
+    timestamp_column = Columns.TIMESTAMP if Columns.TIMESTAMP in df.columns else df.columns[0]
     config.dataset_spec and validate_schema(set(df.columns), config.dataset_spec)
 
     feature_cols = [
         col for col in ["Temperature_C", "Vibration_g", "OilPressure_psi", "Load_kVA"]
         if col in df.columns
     ]
-    feature_cols or (_ := ValueError(
-        "No feature columns found. Expected: Temperature_C, Vibration_g, OilPressure_psi, Load_kVA"
-    ))
-
-    # Anomaly detection using short-circuit evaluation
-    (HAS_ANOMSMITH and anomsmith is not None) and (
-        hasattr(anomsmith, "detect_anomalies") and
-        (result := anomsmith.detect_anomalies(df[feature_cols])) and
-        isinstance(result, dict) and
-        (df := df.assign(
-            **{
-                Columns.ANOMALY_SCORE: result.get("scores", result.get("score")),
-                Columns.IS_ANOMALY: result.get("labels", result.get("anomalies")),
-            }
-        ))
-    )
-
-    # Fallback using vectorized operations
-    (Columns.ANOMALY_SCORE not in df.columns) and (
-        (lambda df_inner=df, cols=feature_cols: (
-            (IsolationForest := __import__("sklearn.ensemble", fromlist=["IsolationForest"]).IsolationForest) and
-            (model := IsolationForest(contamination=0.1, random_state=42)) and
-            (df := df_inner.assign(
-                **{
-                    Columns.IS_ANOMALY: model.fit_predict(df_inner[cols]) == -1,
-                    Columns.ANOMALY_SCORE: -model.score_samples(df_inner[cols]),
-                }
-            ))
-        )()) and
-        (df := df)
-    )
+    if not feature_cols:
+        raise ValueError(
+            "No feature columns found. Expected: Temperature_C, Vibration_g, OilPressure_psi, Load_kVA"
+        )
 
-    metrics = {
-        metric_spec.name: compute_anomaly_metrics(
+    # Anomaly detection: anomsmith when available, else IsolationForest.
+    # The loaded frame is ours, so new columns are set in place rather than copied.
+    if _ANOM_DETECT_FN is not None:
+        result = _ANOM_DETECT_FN(df[feature_cols])
+        if isinstance(result, dict):
+            df[Columns.ANOMALY_SCORE] = result.get("scores", result.get("score"))
+            df[Columns.IS_ANOMALY] = result.get("labels", result.get("anomalies"))
+
+    if Columns.ANOMALY_SCORE not in df.columns:
+        isolation_forest_cls = _lazy_import("sklearn.ensemble", "IsolationForest")
+        features = df[feature_cols]
+        model = isolation_forest_cls(contamination=0.1, random_state=42).fit(features)
+        # One scoring pass: predict() flags score_samples < offset_, i.e. score > -offset_
+        scores = -model.score_samples(features)
+        df[Columns.ANOMALY_SCORE] = scores
+        df[Columns.IS_ANOMALY] = scores > -model.offset_
+
+    metric_names = _metric_names(config, "anomaly")
+    metrics = (
+        compute_anomaly_metrics(
             df["Failure"],
             df[Columns.IS_ANOMALY],
             df.get(Columns.ANOMALY_SCORE),
-            metrics=[metric_spec.name],
-        )[metric_spec.name]
-        for metric_spec in (config.metric_specs or [])
-        if metric_spec.type == "anomaly" and "Failure" in df.columns
-    }
+            metrics=metric_names,
+        )
+        if metric_names and "Failure" in df.columns
+        else {}
+    )
 
     results_table_path = output_dir / "tables" / "predictive_maintenance_results.parquet"
-    save_dataframe(df, results_table_path, format="parquet")
+    save_dataframe(df, results_table_path, format="parquet", **RESULT_TABLE_OPTIONS)
     tables = {"predictive_maintenance_results": str(results_table_path)}
 
     plot_info = (
         Columns.IS_ANOMALY in df.columns and feature_cols and
         plot_anomalies(
-            df.reset_index() if df.index.name else df,
-            timestamp_column=(
-                df.index.name
-                if df.index.name and df.index.name != "index"
-                else df.columns[0]
-            ),
+            df,
+            timestamp_column=timestamp_column,
             value_column=feature_cols[0],
             anomaly_column=Columns.IS_ANOMALY,
             title="Predictive Maintenance Anomaly Detection",
@@ -764,46 +1091,20 @@ def run_outage_prediction_pipeline(config: Config) -> Results:
     metadata = config.metadata or {}
 
     df = (
-        _load_dataframe(input_path)
-        if input_path.exists() and input_path.suffix in [".csv", ".parquet"]
-        else (
-            (np.random.seed(metadata.get("random_state", 42))) and
-            (samples := metadata.get("samples", 1000)) and
-            (wind_speed := np.random.normal(
-                metadata.get("wind_mean", 15.0),
-                metadata.get("wind_std", 8.0),
-                samples
-            )) and
-            (rainfall := np.random.normal(
-                metadata.get("rainfall_mean", 50.0),
-                metadata.get("rainfall_std", 20.0),
-                samples
-            )) and
-            (tree_density := np.random.uniform(
-                metadata.get("tree_density_min", 0.0),
-                metadata.get("tree_density_max", 1.0),
-                samples
-            )) and
-            (asset_age := np.random.uniform(
-                metadata.get("asset_age_min", 0.0),
-                metadata.get("asset_age_max", 50.0),
-                samples
-            )) and
-            (logit := (
-                0.15 * (wind_speed - 25) +
-                0.03 * (rainfall - 60) +
-                2 * (tree_density - 0.5)
-            )) and
-            (outage_prob := 1 / (1 + np.exp(-logit))) and
-            (outages := np.random.binomial(1, outage_prob)) and
-            pd.DataFrame({
-                "WindSpeed_mps": wind_speed,
-                "Rainfall_mm": rainfall,
-                "TreeDensity": tree_density,
-                "AssetAge_years": asset_age,
-                "Outage": outages
-            })
+        _load_dataframe(
+            input_path,
+            Columns.TIMESTAMP,
+            _needed_columns(
+                config,
+                "WindSpeed_mps",
+                "Rainfall_mm",
+                "TreeDensity",
+                "AssetAge_years",
+                "Outage",
+            ),
         )
+        if input_path.exists() and input_path.suffix in [".csv", ".parquet"]
+        else _synthetic_storm_outages(metadata)
     )
 
     config.dataset_spec and validate_schema(set(df.columns), config.dataset_spec)
@@ -812,70 +1113,61 @@ def run_outage_prediction_pipeline(config: Config) -> Results:
         col for col in ["WindSpeed_mps", "Rainfall_mm", "TreeDensity", "AssetAge_years"]
         if col in df.columns
     ]
-    feature_cols or (_ := ValueError(
-        "No feature columns found. Expected: WindSpeed_mps, Rainfall_mm, TreeDensity, AssetAge_years"
-    ))
+    if not feature_cols:
+        raise ValueError(
+            "No feature columns found. Expected: WindSpeed_mps, Rainfall_mm, TreeDensity, AssetAge_years"
+        )
 
-    # Train outage prediction model using vectorized operations
+    # Train outage prediction model
     metrics: dict[str, float] = {}
-    ("Outage" in df.columns) and (
-        (lambda df_inner=df, cols=feature_cols, meta=metadata, out_dir=output_dir: (
-            (GradientBoostingClassifier := __import__("sklearn.ensemble", fromlist=["GradientBoostingClassifier"]).GradientBoostingClassifier) and
-            (train_test_split := __import__("sklearn.model_selection", fromlist=["train_test_split"]).train_test_split) and
-            (roc_auc_score := __import__("sklearn.metrics", fromlist=["roc_auc_score"]).roc_auc_score) and
-            (permutation_importance := __import__("sklearn.inspection", fromlist=["permutation_importance"]).permutation_importance) and
-            (X := df_inner[cols]) and
-            (y := df_inner["Outage"]) and
-            (test_size := meta.get("test_size", 0.2)) and
-            (X_train, X_test, y_train, y_test := train_test_split(
-                X, y,
-                test_size=test_size,
-                random_state=meta.get("random_state", 42),
-                stratify=y if y.nunique() > 1 else None
-            )) and
-            (model := GradientBoostingClassifier(
-                n_estimators=meta.get("n_estimators", 100),
-                learning_rate=meta.get("learning_rate", 0.1),
-                max_depth=meta.get("max_depth", 3),
-                random_state=meta.get("random_state", 42)
-            )) and
-            model.fit(X_train, y_train) and
-            (y_pred := model.predict(X_test)) and
-            (y_prob := model.predict_proba(X_test)[:, 1]) and
-            (df_inner := df_inner.assign(**{
-                "predicted_outage": pd.Series(y_pred, index=X_test.index),
-                "outage_probability": pd.Series(y_prob, index=X_test.index),
-            })) and
-            (y_test.nunique() > 1) and (
-                (metrics_dict.update({"roc_auc": float(roc_auc_score(y_test, y_prob))})) and
-                metrics_dict.update(compute_anomaly_metrics(
-                    y_test,
-                    y_pred,
-                    pd.Series(y_prob),
-                    metrics=["precision", "recall", "f1"]
-                )) and
-                (result := permutation_importance(
-                    model, X_test, y_test,
-                    n_repeats=10,
-                    random_state=meta.get("random_state", 42)
-                )) and
-                (feature_importance_df := pd.DataFrame({
-                    "Feature": X.columns,
-                    "Importance": result.importances_mean
-                }).sort_values("Importance", ascending=False)) and
-                (importance_path := out_dir / "tables" / "feature_importance.parquet") and
-                save_dataframe(feature_importance_df, importance_path, format="parquet")
-            ) and
-            df_inner
-        )()) and
-        (df := _) and
-        (metrics := metrics) and
-        None
-    )
+    if "Outage" in df.columns:
+        train_test_split = _lazy_import("sklearn.model_selection", "train_test_split")
+        classifier_cls = _lazy_import("sklearn.ensemble", "GradientBoostingClassifier")
+
+        features = df[feature_cols]
+        y = df["Outage"]
+        features_train, features_test, y_train, y_test = train_test_split(
+            features, y,
+            test_size=metadata.get("test_size", 0.2),
+            random_state=metadata.get("random_state", 42),
+            stratify=y if y.nunique() > 1 else None,
+        )
+        model = classifier_cls(
+            n_estimators=metadata.get("n_estimators", 100),
+            learning_rate=metadata.get("learning_rate", 0.1),
+            max_depth=metadata.get("max_depth", 3),
+            random_state=metadata.get("random_state", 42),
+        ).fit(features_train, y_train)
+        y_pred = model.predict(features_test)
+        y_prob = model.predict_proba(features_test)[:, 1]
+        df = df.assign(
+            predicted_outage=pd.Series(y_pred, index=features_test.index),
+            outage_probability=pd.Series(y_prob, index=features_test.index),
+        )
+
+        if y_test.nunique() > 1:
+            roc_auc_score = _lazy_import("sklearn.metrics", "roc_auc_score")
+            permutation_importance = _lazy_import("sklearn.inspection", "permutation_importance")
+
+            metrics["roc_auc"] = float(roc_auc_score(y_test, y_prob))
+            metrics.update(compute_anomaly_metrics(
+                y_test, y_pred, y_prob, metrics=["precision", "recall", "f1"]
+            ))
+            result = permutation_importance(
+                model, features_test, y_test,
+                n_repeats=10,
+                random_state=metadata.get("random_state", 42),
+            )
+            feature_importance_df = pd.DataFrame({
+                "Feature": features.columns,
+                "Importance": result.importances_mean,
+            }).sort_values("Importance", ascending=False)
+            importance_path = output_dir / "tables" / "feature_importance.parquet"
+            save_dataframe(feature_importance_df, importance_path, format="parquet", **RESULT_TABLE_OPTIONS)
 
     # Save output tables
     results_table_path = output_dir / "tables" / "outage_prediction_results.parquet"
-    save_dataframe(df, results_table_path, format="parquet")
+    save_dataframe(df, results_table_path, format="parquet", **RESULT_TABLE_OPTIONS)
     tables: dict[str, str] = {"outage_prediction_results": str(results_table_path)}
 
     # Generate plots
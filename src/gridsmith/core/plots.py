@@ -4,98 +4,693 @@ This module provides wrappers for plotting functionality.
 Return figure objects and file paths.
 """
 
+import atexit
+import contextlib
+import functools
+import hashlib
+import importlib
+import math
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import warnings
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Optional, Union
+from types import ModuleType
+from typing import Any, Callable, Optional, Union
 
+import numpy as np
 import pandas as pd
 
-# Try to import Smith libraries with graceful fallback
-try:
-    import plotsmith
+# Set GRIDSMITH_NO_PLOT to skip the Smith plotting libraries entirely
+_PLOTSMITH_DISABLED = bool(os.environ.get("GRIDSMITH_NO_PLOT"))
 
-    HAS_PLOTSMITH = True
-except ImportError:
-    HAS_PLOTSMITH = False
-    plotsmith = None
 
-try:
-    import timesmith
+def _import_optional(name: str) -> Optional[ModuleType]:
+    """Import an optional plotting library, returning None when unavailable."""
+    if _PLOTSMITH_DISABLED:
+        return None
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
-    HAS_TIMESMITH = True
-except ImportError:
-    HAS_TIMESMITH = False
-    timesmith = None
+
+# plotsmith/timesmith (and matplotlib behind them) are imported on first plot
+@functools.lru_cache(maxsize=1)
+def _get_plotsmith() -> Optional[ModuleType]:
+    """Return the plotsmith module, importing it on first use."""
+    return _import_optional("plotsmith")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_timesmith() -> Optional[ModuleType]:
+    """Return the timesmith module, importing it on first use."""
+    return _import_optional("timesmith")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pyplot() -> Optional[ModuleType]:
+    """Return matplotlib.pyplot, importing it on first use."""
+    return _import_optional("matplotlib.pyplot")
+
+
+# Set GRIDSMITH_LAZY_RESULTS=1 to compute "data_shape" only when it is read
+_LAZY_RESULTS = os.environ.get("GRIDSMITH_LAZY_RESULTS") == "1"
+
+
+class PlotResult(dict):
+    """Plot metadata dict whose ``data_shape`` entry is computed on first access.
+
+    The plotted frame is referenced, not traversed, until ``data_shape`` is read.
+    Until then the key is absent from iteration and ``dict(result)`` copies.
+    """
+
+    def __init__(self, data: pd.DataFrame, metadata: dict[str, Any]) -> None:
+        super().__init__(metadata)
+        self._data = data
+
+    @functools.cached_property
+    def data_shape(self) -> tuple[int, ...]:
+        """Shape of the plotted frame."""
+        return self._data.shape
+
+    def __missing__(self, key: str) -> Any:
+        if key != "data_shape":
+            raise KeyError(key)
+        self["data_shape"] = self.data_shape
+        return self.data_shape
+
+    def __contains__(self, key: object) -> bool:
+        return key == "data_shape" or super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return ``self[key]`` if present (including ``data_shape``), else ``default``."""
+        return self[key] if key in self else default
+
+
+def _plot_result(data: pd.DataFrame, metadata: dict[str, Any]) -> dict[str, Any]:
+    """Attach the frame's shape to plot metadata, lazily when enabled."""
+    if _LAZY_RESULTS:
+        return PlotResult(data, metadata)
+    return {**metadata, "data_shape": data.shape}
+
+
+# Directories _ensure_dir has already created in this process
+_CREATED_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create ``path`` (and parents) once per process; repeat calls are free."""
+    if path not in _CREATED_DIRS:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+
+def _save_to(output_path_obj: Path, save: Callable[[], Any]) -> Any:
+    """Ensure ``output_path_obj``'s directory exists, then run ``save``.
+
+    A directory removed since _ensure_dir created it makes the save raise
+    FileNotFoundError; it is then forgotten, recreated and the save retried once.
+    """
+    parent = str(output_path_obj.parent)
+    _ensure_dir(parent)
+    try:
+        return save()
+    except FileNotFoundError:
+        _CREATED_DIRS.discard(parent)
+        _ensure_dir(parent)
+        return save()
+
+
+# Memoized renders (cache=True): key -> (result metadata, cached copy of the saved
+# figure). Figure copies live in a per-process temp dir removed at exit.
+_PLOT_CACHE: "OrderedDict[Hashable, tuple[dict[str, Any], Optional[Path]]]" = OrderedDict()
+_PLOT_CACHE_MAXSIZE = 128
+_PLOT_CACHE_DIR: Optional[Path] = None
+
+
+def _plot_cache_dir() -> Path:
+    """Return this process's figure cache directory, creating it on first use."""
+    global _PLOT_CACHE_DIR
+    if _PLOT_CACHE_DIR is None:
+        _PLOT_CACHE_DIR = Path(tempfile.mkdtemp(prefix="gridsmith-plots-"))
+        atexit.register(shutil.rmtree, _PLOT_CACHE_DIR, ignore_errors=True)
+    return _PLOT_CACHE_DIR
+
+
+def clear_plot_cache() -> None:
+    """Drop all memoized plot renders and their cached figure files."""
+    for _, figure_file in _PLOT_CACHE.values():
+        if figure_file is not None:
+            figure_file.unlink(missing_ok=True)
+    _PLOT_CACHE.clear()
+
+
+def _plot_cache_key(
+    kind: str,
+    data: pd.DataFrame,
+    columns: list,
+    title: Optional[str],
+    output_path_obj: Optional[Path],
+    kwargs: dict[str, Any],
+) -> Optional[Hashable]:
+    """Return a memoization key for a render, or None if it should not be cached.
+
+    Only the plotted columns are hashed, so the key costs O(rows x plotted
+    columns) however wide the frame is. Frames whose plotted columns hold
+    Python strings are not cached: hashing them would cost more than the plot.
+    """
+    on_index = any(_uses_index(data, column) for column in columns)
+    key_df = data[list(dict.fromkeys(c for c in columns if not _uses_index(data, c)))]
+    dtypes = [*key_df.dtypes, data.index.dtype] if on_index else list(key_df.dtypes)
+    if any(
+        pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+        for dtype in dtypes
+    ):
+        return None
+
+    row_hashes = pd.util.hash_pandas_object(key_df, index=on_index, categorize=False)
+    fingerprint = (
+        data.shape,
+        tuple(str(dtype) for dtype in dtypes),
+        hashlib.blake2b(row_hashes.to_numpy().tobytes(), digest_size=16).digest(),
+    )
+    suffix = output_path_obj.suffix if output_path_obj else None
+    key = (kind, fingerprint, tuple(columns), title, suffix, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _cached_plot(
+    key: Optional[Hashable], output_path_obj: Optional[Path]
+) -> Optional[dict[str, Any]]:
+    """Return memoized metadata for ``key``, copying the saved figure to ``output_path_obj``."""
+    entry = _PLOT_CACHE.get(key) if key is not None else None
+    if entry is None:
+        return None
+
+    result, figure_file = entry
+    if output_path_obj:
+        if figure_file is None or not figure_file.exists():
+            return None
+        _save_to(output_path_obj, functools.partial(shutil.copyfile, figure_file, output_path_obj))
+
+    _PLOT_CACHE.move_to_end(key)
+    return {**result, "output_path": str(output_path_obj) if output_path_obj else None}
+
+
+def _copy_to_cache(output_path_obj: Path, figure_file: Path) -> None:
+    """Copy a saved figure into the plot cache, ignoring filesystem errors."""
+    partial = figure_file.with_suffix(figure_file.suffix + ".tmp")
+    try:
+        _ensure_dir(str(figure_file.parent))
+        shutil.copyfile(output_path_obj, partial)
+        os.replace(partial, figure_file)
+    except OSError:
+        pass
+
+
+def _store_plot(
+    key: Optional[Hashable],
+    result: dict[str, Any],
+    output_path_obj: Optional[Path],
+    pending_save: Optional[Future] = None,
+) -> None:
+    """Memoize a render's metadata and keep a copy of its saved figure.
+
+    When the figure is still being written in the background, the copy is made
+    once ``pending_save`` completes; until then lookups miss and rerender.
+    """
+    if key is None:
+        return
+
+    figure_file = None
+    if output_path_obj:
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        figure_file = _plot_cache_dir() / f"{digest}{output_path_obj.suffix}"
+        if pending_save is not None:
+
+            def copy_when_saved(future: Future) -> None:
+                if future.exception() is None:
+                    _copy_to_cache(output_path_obj, figure_file)
+
+            pending_save.add_done_callback(copy_when_saved)
+        elif output_path_obj.exists():
+            _copy_to_cache(output_path_obj, figure_file)
+
+    metadata = {k: v for k, v in result.items() if k != "save_future"}
+    metadata["data_shape"] = result["data_shape"]
+    _PLOT_CACHE[key] = (metadata, figure_file)
+    _PLOT_CACHE.move_to_end(key)
+    if len(_PLOT_CACHE) > _PLOT_CACHE_MAXSIZE:
+        _, (_, evicted) = _PLOT_CACHE.popitem(last=False)
+        if evicted is not None and evicted != figure_file:
+            evicted.unlink(missing_ok=True)
+
+
+# Opt-in background figure writer (GRIDSMITH_BACKGROUND_SAVE=1): one worker
+# process, since matplotlib is not thread-safe. It is spawned rather than forked:
+# forking after numba's TBB threads have started leaves the parent unable to exit.
+_SAVE_POOL: Optional[ProcessPoolExecutor] = None
+_PENDING_SAVES: list[Future] = []
+
+
+def _get_save_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the figure-saving pool, or None unless GRIDSMITH_BACKGROUND_SAVE is set.
+
+    GRIDSMITH_SINGLECORE always saves in-process.
+    """
+    global _SAVE_POOL
+    if not os.environ.get("GRIDSMITH_BACKGROUND_SAVE") or os.environ.get("GRIDSMITH_SINGLECORE"):
+        return None
+    if _SAVE_POOL is None:
+        _SAVE_POOL = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        atexit.register(_SAVE_POOL.shutdown)
+    return _SAVE_POOL
+
+
+def _save_figure(figure_bytes: bytes, path: str) -> None:
+    """Unpickle a figure and write it to ``path`` (runs in the save pool)."""
+    figure = pickle.loads(figure_bytes)
+    _save_to(Path(path), functools.partial(figure.savefig, path))
+
+
+def _submit_savefig(fig: Any, path: Path) -> Optional[Future]:
+    """Save ``fig`` in the background when enabled and picklable, else synchronously.
+
+    Returns the pending save, or None when the figure was written in-process.
+    """
+    pool = _get_save_pool()
+    if pool is not None:
+        try:
+            figure_bytes = pickle.dumps(fig)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            pass
+        else:
+            future = pool.submit(_save_figure, figure_bytes, str(path))
+            _PENDING_SAVES[:] = [f for f in _PENDING_SAVES if not f.done()]
+            _PENDING_SAVES.append(future)
+            return future
+
+    _save_to(path, functools.partial(fig.savefig, path))
+    return None
+
+
+def flush() -> None:
+    """Block until every background figure save has finished.
+
+    Raises:
+        Exception: The first error raised while writing a figure
+    """
+    pending, _PENDING_SAVES[:] = _PENDING_SAVES[:], []
+    for future in pending:
+        future.result()
+
+
+# Errors meaning an installed Smith library is incompatible with a call shape:
+# they fall back to metadata (without an output_path, since nothing is saved)
+# and later calls with that shape skip straight to the fallback. Any other
+# exception, including TypeError/ValueError, is raised as RuntimeError.
+_SMITH_ERRORS = (ImportError, AttributeError)
+_SMITH_FAIL_KEYS: set[tuple] = set()
+
+
+def clear_plot_failures() -> None:
+    """Forget remembered plotsmith/timesmith failures so every call retries them."""
+    _SMITH_FAIL_KEYS.clear()
+
+
+def _record_smith_failure(fail_key: tuple, library: str, error: Exception) -> None:
+    """Remember an incompatible call shape and warn that metadata is returned instead."""
+    _SMITH_FAIL_KEYS.add(fail_key)
+    warnings.warn(f"{library} plotting failed, returning metadata only: {error}")
+
+
+# matplotlib's default figure width (inches) and resolution
+_DEFAULT_FIGSIZE_WIDTH = 6.4
+_DEFAULT_DPI = 100
+
+
+def _pixel_width(kwargs: dict[str, Any]) -> int:
+    """Return the rendered plot width in pixel columns implied by plotting kwargs."""
+    figsize = kwargs.get("figsize")
+    inches = figsize[0] if figsize else _DEFAULT_FIGSIZE_WIDTH
+    return max(1, int(inches * (kwargs.get("dpi") or _DEFAULT_DPI)))
+
+
+def _m4_aggregate(
+    data: Union[pd.Series, pd.DataFrame], width: int
+) -> Union[pd.Series, pd.DataFrame]:
+    """Reduce a series to the first, last, min and max point of each pixel column.
+
+    This is M4 aggregation: a line drawn through the kept points rasterizes to
+    the same image as the full series. Buckets are a power-of-two number of
+    rows so the selection is stable across nearby output widths. Inputs of up
+    to ``4 * width`` rows, with non-numeric columns, or whose x values (the
+    index) are not sorted, e.g. a scatter against temperature, are returned
+    unchanged: row buckets only map to pixel columns when x increases.
+    """
+    n = len(data)
+    if n <= 4 * width or not data.index.is_monotonic_increasing:
+        return data
+
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes):
+        return data
+
+    bucket = 1 << int(math.log2(n / width))
+    n_buckets = -(-n // bucket)
+    pad = n_buckets * bucket - n
+    starts = np.arange(n_buckets) * bucket
+
+    positions = [starts, np.minimum(starts + bucket, n) - 1]
+    for column in frame.columns:
+        values = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        low = np.pad(np.where(missing, np.inf, values), (0, pad), constant_values=np.inf)
+        high = np.pad(np.where(missing, -np.inf, values), (0, pad), constant_values=-np.inf)
+        positions.append(starts + low.reshape(n_buckets, bucket).argmin(axis=1))
+        positions.append(starts + high.reshape(n_buckets, bucket).argmax(axis=1))
+
+    return data.iloc[np.unique(np.concatenate(positions))]
+
+
+def _quantize(
+    data: Union[pd.Series, pd.DataFrame], precision: str
+) -> Union[pd.Series, pd.DataFrame]:
+    """Down-cast float plot values to ``precision`` as one contiguous array.
+
+    Screen rendering needs far fewer digits than float64 carries, and a narrow
+    contiguous buffer is cheaper for matplotlib to walk. Non-float data and
+    values outside the target type's range are returned unchanged.
+    """
+    dtype = np.dtype(precision)
+    dtypes = [data.dtype] if isinstance(data, pd.Series) else list(data.dtypes)
+    if dtype == np.float64 or not dtypes or not all(map(pd.api.types.is_float_dtype, dtypes)):
+        return data
+
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = values[np.isfinite(values)]
+    if finite.size and np.abs(finite).max() >= np.finfo(dtype).max:
+        return data
+
+    values = np.ascontiguousarray(values, dtype=dtype)
+    if isinstance(data, pd.Series):
+        return pd.Series(values, index=data.index, name=data.name, copy=False)
+    return pd.DataFrame(values, index=data.index, columns=data.columns, copy=False)
+
+
+def _contiguous(data: Union[pd.Series, pd.DataFrame]) -> Union[pd.Series, pd.DataFrame]:
+    """Return ``data`` backed by one C-contiguous NumPy array, copying only if needed.
+
+    Multi-column selections come back column-major from pandas' blocks, which
+    matplotlib would otherwise copy on every draw. Extension-array and object
+    data are returned unchanged; the index is left as-is.
+    """
+    dtypes = [data.dtype] if isinstance(data, pd.Series) else list(data.dtypes)
+    if not all(isinstance(dtype, np.dtype) and dtype.kind != "O" for dtype in dtypes):
+        return data
+
+    values = data.to_numpy()
+    if values.flags["C_CONTIGUOUS"]:
+        return data
+
+    values = np.ascontiguousarray(values)
+    if isinstance(data, pd.Series):
+        return pd.Series(values, index=data.index, name=data.name, copy=False)
+    # copy=False keeps pandas from re-laying the array out column-major
+    return pd.DataFrame(values, index=data.index, columns=data.columns, copy=False)
+
+
+def _uses_index(data: pd.DataFrame, column: Optional[str]) -> bool:
+    """Return True when ``column`` refers to the frame's index rather than a column."""
+    return column is None or (column not in data.columns and column == data.index.name)
+
+
+def _series_plot_data(
+    data: pd.DataFrame,
+    x_column: Optional[str],
+    y_columns_list: list,
+    width: int,
+    precision: str = "float32",
+) -> Union[pd.Series, pd.DataFrame]:
+    """Select the y column(s) indexed by ``x_column``, reduced to ``width`` pixels.
+
+    Only the plotted columns are taken; ``set_index`` would copy the whole frame.
+    When ``x_column`` is None or names the index, the existing index is used.
+    """
+    columns = y_columns_list[0] if len(y_columns_list) == 1 else y_columns_list
+    plot_data = data[columns]
+    if not _uses_index(data, x_column):
+        plot_data = plot_data.set_axis(pd.Index(data[x_column], name=x_column))
+    return _contiguous(_quantize(_m4_aggregate(plot_data, width), precision))
+
+
+def _forecast_plot_data(
+    data: pd.DataFrame,
+    timestamp_column: Optional[str],
+    actual_column: str,
+    forecast_column: str,
+    width: int,
+    precision: str = "float32",
+) -> tuple[pd.Series, pd.Series]:
+    """Return the non-missing (historical, forecast) series, reduced to ``width`` pixels."""
+    if _uses_index(data, timestamp_column):
+        timestamps, index_name = data.index.to_numpy(), data.index.name
+    else:
+        timestamps, index_name = data[timestamp_column].to_numpy(), timestamp_column
+    actual = data[actual_column].to_numpy()
+    predicted = data[forecast_column].to_numpy()
+    has_actual = ~pd.isna(actual)
+    has_forecast = ~pd.isna(predicted)
+
+    historical = pd.Series(
+        actual[has_actual],
+        index=pd.Index(timestamps[has_actual], name=index_name),
+        name=actual_column,
+    )
+    forecast = pd.Series(
+        predicted[has_forecast],
+        index=pd.Index(timestamps[has_forecast], name=index_name),
+        name=forecast_column,
+    )
+    return (
+        _quantize(_m4_aggregate(historical, width), precision),
+        _quantize(_m4_aggregate(forecast, width), precision),
+    )
+
+
+def _render_time_series(
+    plotsmith: ModuleType,
+    data: pd.DataFrame,
+    x_column: Optional[str],
+    y_columns_list: list,
+    title: Optional[str],
+    output_path_obj: Optional[Path],
+    precision: str,
+    kwargs: dict[str, Any],
+) -> Any:
+    """Draw (and optionally save) a time series with plotsmith.
+
+    Returns:
+        Whatever plotsmith.plot_timeseries returns (the figure)
+
+    Raises:
+        RuntimeError: If plotsmith fails with an error outside ``_SMITH_ERRORS``
+    """
+    try:
+        plot_data = _series_plot_data(
+            data, x_column, y_columns_list, _pixel_width(kwargs), precision
+        )
+
+        draw = functools.partial(
+            plotsmith.plot_timeseries,
+            plot_data,
+            title=title,
+            save_path=str(output_path_obj) if output_path_obj else None,
+            **kwargs,
+        )
+        return _save_to(output_path_obj, draw) if output_path_obj else draw()
+    except _SMITH_ERRORS:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"Plotsmith plot_time_series failed: {e}") from e
+
+
+class LazyPlot(PlotResult):
+    """Plot metadata whose figure is only rendered when it is used.
+
+    Reading ``result["figure"]`` or ``result.figure``, or calling :meth:`show`
+    or :meth:`save`, renders once; every other key is plain metadata. Call
+    :meth:`_evaluate` to force the render explicitly.
+    """
+
+    def __init__(
+        self, data: pd.DataFrame, metadata: dict[str, Any], render: Callable[[], Any]
+    ) -> None:
+        super().__init__(data, metadata)
+        self._render = render
+
+    def _evaluate(self) -> Any:
+        """Render the figure if that has not happened yet, and return it."""
+        if not dict.__contains__(self, "figure"):
+            self["figure"] = self._render()
+        return dict.__getitem__(self, "figure")
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "figure":
+            return self._evaluate()
+        return super().__getitem__(key)
+
+    @property
+    def figure(self) -> Any:
+        """The rendered figure."""
+        return self._evaluate()
+
+    def show(self) -> None:
+        """Render the figure and display it with pyplot."""
+        self._evaluate()
+        pyplot = _get_pyplot()
+        if pyplot is not None:
+            pyplot.show()
+
+    def save(self, output_path: Union[str, Path]) -> str:
+        """Render the figure and save it to ``output_path``.
+
+        Returns:
+            The saved path, also recorded under ``"output_path"``
+        """
+        figure = self._evaluate()
+        figure = figure[0] if isinstance(figure, tuple) else figure
+        output_path_obj = Path(output_path)
+        _save_to(output_path_obj, functools.partial(figure.savefig, output_path_obj))
+        self["output_path"] = str(output_path_obj)
+        return self["output_path"]
 
 
 def plot_time_series(
     data: pd.DataFrame,
-    x_column: str,
+    x_column: Optional[str],
     y_columns: Union[str, list],
     title: Optional[str] = None,
     output_path: Optional[Union[str, Path]] = None,
+    cache: bool = False,
+    render: bool = False,
+    precision: str = "float32",
     **kwargs: Any,
 ) -> dict[str, Any]:
     """Create a time series plot.
 
-    Delegates to plotsmith when available.
+    Delegates to plotsmith when available. With ``cache=True``, repeated calls
+    with the same data, title and kwargs reuse the previous render (copying its
+    saved figure).
+    Without an ``output_path`` nothing is drawn up front: the result is a
+    :class:`LazyPlot` that renders when its figure is used.
 
     Args:
         data: DataFrame with time series data
-        x_column: Column name for x-axis (typically timestamp)
+        x_column: Column name for x-axis (typically timestamp); None or the
+            index name plots against the existing index
         y_columns: Column name(s) for y-axis
         title: Optional plot title
         output_path: Optional path to save figure
+        cache: Reuse a memoized render for identical inputs within this process
+        render: Draw immediately even when no ``output_path`` is given
+        precision: Float dtype the plotted values are cast to
+            ("float16", "float32" or "float64" to keep full precision)
         **kwargs: Additional plotting arguments
 
     Returns:
         Dictionary with plot metadata and saved path if applicable
     """
     y_columns_list = [y_columns] if isinstance(y_columns, str) else y_columns
+    output_path_obj = Path(output_path) if output_path else None
+    output_path_str = str(output_path_obj) if output_path_obj else None
+    fail_key = ("time_series", tuple(sorted(kwargs)), len(y_columns_list))
 
-    # Try plotsmith first
-    if HAS_PLOTSMITH and plotsmith is not None:
-        try:
-            plot_data = data.set_index(x_column)
-            plot_data = (
-                plot_data[y_columns_list[0]]
-                if len(y_columns_list) == 1
-                else plot_data[y_columns_list]
+    # Try plotsmith first, unless it already failed for this call shape
+    smith_failed = fail_key in _SMITH_FAIL_KEYS
+    plotsmith = None if smith_failed else _get_plotsmith()
+    if plotsmith is not None:
+        metadata = {
+            "type": "time_series",
+            "x_column": x_column,
+            "y_columns": y_columns_list,
+            "title": title,
+            "output_path": output_path_str,
+        }
+        if output_path_obj is None and not render:
+            return LazyPlot(
+                data,
+                _plot_result(data, metadata),
+                functools.partial(
+                    _render_time_series,
+                    plotsmith,
+                    data,
+                    x_column,
+                    y_columns_list,
+                    title,
+                    None,
+                    precision,
+                    kwargs,
+                ),
             )
 
-            output_path_obj = Path(output_path) if output_path else None
-            output_path_obj and output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-
-            plotsmith.plot_timeseries(
-                plot_data,
-                title=title,
-                save_path=str(output_path) if output_path else None,
-                **kwargs,
+        key = (
+            _plot_cache_key(
+                "time_series",
+                data,
+                [x_column, *y_columns_list],
+                title,
+                output_path_obj,
+                {**kwargs, "precision": precision},
             )
+            if cache
+            else None
+        )
+        cached = _cached_plot(key, output_path_obj)
+        if cached is not None:
+            return cached
 
-            return {
-                "type": "time_series",
-                "x_column": x_column,
-                "y_columns": y_columns_list,
-                "title": title,
-                "output_path": str(output_path) if output_path else None,
-                "data_shape": data.shape,
-            }
-        except Exception as e:
-            raise RuntimeError(f"Plotsmith plot_time_series failed: {e}") from e
+        try:
+            _render_time_series(
+                plotsmith, data, x_column, y_columns_list, title, output_path_obj, precision, kwargs
+            )
+        except _SMITH_ERRORS as e:
+            smith_failed = True
+            _record_smith_failure(fail_key, "plotsmith", e)
+        else:
+            result = _plot_result(data, metadata)
+            _store_plot(key, result, output_path_obj)
+            return result
 
     # Fallback: return metadata only
-    result = {
-        "type": "time_series",
-        "x_column": x_column,
-        "y_columns": y_columns_list,
-        "title": title,
-        "data_shape": data.shape,
-    }
-
-    if output_path:
-        output_path_obj = Path(output_path)
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        result["output_path"] = str(output_path)
+    result = _plot_result(
+        data,
+        {
+            "type": "time_series",
+            "x_column": x_column,
+            "y_columns": y_columns_list,
+            "title": title,
+        },
+    )
+
+    # A failed Smith call saved nothing, so no output_path is reported
+    if output_path_obj and not smith_failed:
+        _ensure_dir(str(output_path_obj.parent))
+        result["output_path"] = output_path_str
 
     return result
 
@@ -125,94 +720,469 @@ def plot_anomalies(
     Returns:
         Dictionary with plot metadata and saved path if applicable
     """
-    result = {
-        "type": "anomaly",
-        "timestamp_column": timestamp_column,
-        "value_column": value_column,
-        "anomaly_column": anomaly_column,
-        "title": title,
-        "data_shape": data.shape,
-    }
+    output_path_obj = Path(output_path) if output_path else None
+    output_path_str = str(output_path_obj) if output_path_obj else None
 
-    if output_path:
-        output_path_obj = Path(output_path)
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        result["output_path"] = str(output_path)
+    result = _plot_result(
+        data,
+        {
+            "type": "anomaly",
+            "timestamp_column": timestamp_column,
+            "value_column": value_column,
+            "anomaly_column": anomaly_column,
+            "title": title,
+        },
+    )
+
+    if output_path_obj:
+        _ensure_dir(str(output_path_obj.parent))
+        result["output_path"] = output_path_str
 
     return result
 
 
+def _draw_on_axes(draw: Any, ax: Any, *args: Any, **kwargs: Any) -> bool:
+    """Call a Smith plotting function on an existing axes.
+
+    Returns:
+        False when the library is missing or does not accept ``ax=``
+    """
+    if draw is None:
+        return False
+    try:
+        draw(*args, ax=ax, **kwargs)
+    except TypeError:
+        return False
+    return True
+
+
+def _plot_forecast_on_axes(
+    ax: Any,
+    historical: pd.Series,
+    forecast: pd.Series,
+    title: Optional[str],
+) -> None:
+    """Draw actual and forecast lines directly with matplotlib."""
+    ax.plot(historical.index, historical.to_numpy(), label=historical.name)
+    ax.plot(forecast.index, forecast.to_numpy(), label=forecast.name)
+    ax.set_title(title or "")
+    ax.legend()
+
+
+# Long-lived figure reused by plot_forecast(reuse_fig=True); pyplot state is
+# process-global, so drawing into it is serialized
+_REUSABLE_FIG: Optional[tuple[Any, Any]] = None
+_REUSABLE_FIG_LOCK = threading.Lock()
+
+
+def _reusable_axes() -> Optional[tuple[Any, Any]]:
+    """Return the shared (figure, axes), cleared for the next plot.
+
+    Callers must hold ``_REUSABLE_FIG_LOCK``. Returns None without matplotlib.
+    """
+    global _REUSABLE_FIG
+    pyplot = _get_pyplot()
+    if pyplot is None:
+        return None
+    if _REUSABLE_FIG is None:
+        _REUSABLE_FIG = pyplot.subplots()
+    else:
+        _REUSABLE_FIG[1].clear()
+    return _REUSABLE_FIG
+
+
 def plot_forecast(
     data: pd.DataFrame,
-    timestamp_column: str,
+    timestamp_column: Optional[str],
     actual_column: str,
     forecast_column: str,
     title: Optional[str] = None,
     output_path: Optional[Union[str, Path]] = None,
+    cache: bool = False,
+    precision: str = "float32",
+    reuse_fig: bool = False,
     **kwargs: Any,
 ) -> dict[str, Any]:
     """Create a forecast visualization plot.
 
-    Uses timesmith.plot_forecast when available.
+    Uses timesmith.plot_forecast when available. With ``cache=True``, repeated
+    calls with the same data, title and kwargs reuse the previous render
+    (copying its saved figure).
+    The figure is saved before returning. With GRIDSMITH_BACKGROUND_SAVE=1 it
+    is written by a background process instead: the result's ``save_future``
+    completes once the file exists, and :func:`flush` waits for all pending saves.
 
     Args:
         data: DataFrame with actual and forecasted values
-        timestamp_column: Column name for timestamps
+        timestamp_column: Column name for timestamps; None or the index name
+            plots against the existing (e.g. DatetimeIndex) index
         actual_column: Column name for actual values
         forecast_column: Column name for forecasted values
         title: Optional plot title
         output_path: Optional path to save figure
+        cache: Reuse a memoized render for identical inputs within this process
+        precision: Float dtype the plotted values are cast to
+        reuse_fig: Draw into one long-lived figure (cleared between calls)
+            instead of creating a new figure each time
         **kwargs: Additional plotting arguments
 
     Returns:
         Dictionary with plot metadata and saved path if applicable
     """
-    # Try timesmith first
-    if HAS_TIMESMITH and timesmith is not None:
-        try:
-            plot_data = data.set_index(timestamp_column)
-            historical = plot_data[actual_column].dropna()
-            forecast = plot_data[forecast_column].dropna()
-
-            fig, ax = timesmith.plot_forecast(
-                historical,
-                forecast,
-                title=title or "Forecast",
-                **kwargs,
+    output_path_obj = Path(output_path) if output_path else None
+    output_path_str = str(output_path_obj) if output_path_obj else None
+    fail_key = ("forecast", tuple(sorted(kwargs)), reuse_fig)
+
+    # Try timesmith first, unless it already failed for this call shape
+    smith_failed = fail_key in _SMITH_FAIL_KEYS
+    timesmith = None if smith_failed else _get_timesmith()
+    if timesmith is not None:
+        key = (
+            _plot_cache_key(
+                "forecast",
+                data,
+                [timestamp_column, actual_column, forecast_column],
+                title,
+                output_path_obj,
+                {**kwargs, "precision": precision},
             )
+            if cache
+            else None
+        )
+        cached = _cached_plot(key, output_path_obj)
+        if cached is not None:
+            return cached
+
+        drawn = False
+        save_future = None
+        with _REUSABLE_FIG_LOCK if reuse_fig else contextlib.nullcontext():
+            try:
+                historical, forecast = _forecast_plot_data(
+                    data,
+                    timestamp_column,
+                    actual_column,
+                    forecast_column,
+                    _pixel_width(kwargs),
+                    precision,
+                )
 
-            output_path_str = None
-            if output_path:
-                output_path_obj = Path(output_path)
-                output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-                fig.savefig(output_path_obj)
-                output_path_str = str(output_path)
-
-            return {
-                "type": "forecast",
-                "timestamp_column": timestamp_column,
-                "actual_column": actual_column,
-                "forecast_column": forecast_column,
-                "title": title,
-                "output_path": output_path_str,
-                "data_shape": data.shape,
-            }
-        except Exception as e:
-            raise RuntimeError(f"Timesmith plot_forecast failed: {e}") from e
+                reusable = _reusable_axes() if reuse_fig else None
+                if reusable is None:
+                    fig, ax = timesmith.plot_forecast(
+                        historical,
+                        forecast,
+                        title=title or "Forecast",
+                        **kwargs,
+                    )
+                else:
+                    fig, ax = reusable
+                    if not _draw_on_axes(
+                        timesmith.plot_forecast,
+                        ax,
+                        historical,
+                        forecast,
+                        title=title or "Forecast",
+                        **kwargs,
+                    ):
+                        _plot_forecast_on_axes(ax, historical, forecast, title or "Forecast")
+            except _SMITH_ERRORS as e:
+                smith_failed = True
+                _record_smith_failure(fail_key, "timesmith", e)
+            except Exception as e:
+                raise RuntimeError(f"Timesmith plot_forecast failed: {e}") from e
+            else:
+                drawn = True
+
+            # Saved (or pickled for the save pool) before the figure is reused;
+            # save errors such as an unsupported extension propagate
+            if drawn and output_path_obj:
+                _ensure_dir(str(output_path_obj.parent))
+                save_future = _submit_savefig(fig, output_path_obj)
+
+        if drawn:
+            result = _plot_result(
+                data,
+                {
+                    "type": "forecast",
+                    "timestamp_column": timestamp_column,
+                    "actual_column": actual_column,
+                    "forecast_column": forecast_column,
+                    "title": title,
+                    "output_path": output_path_str,
+                },
+            )
+            if save_future is not None:
+                result["save_future"] = save_future
+            _store_plot(key, result, output_path_obj, save_future)
+            return result
 
     # Fallback: return metadata only
-    result = {
-        "type": "forecast",
-        "timestamp_column": timestamp_column,
-        "actual_column": actual_column,
-        "forecast_column": forecast_column,
-        "title": title,
-        "data_shape": data.shape,
-    }
-
-    if output_path:
-        output_path_obj = Path(output_path)
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        result["output_path"] = str(output_path)
+    result = _plot_result(
+        data,
+        {
+            "type": "forecast",
+            "timestamp_column": timestamp_column,
+            "actual_column": actual_column,
+            "forecast_column": forecast_column,
+            "title": title,
+        },
+    )
+
+    # A failed Smith call saved nothing, so no output_path is reported
+    if output_path_obj and not smith_failed:
+        _ensure_dir(str(output_path_obj.parent))
+        result["output_path"] = output_path_str
 
     return result
+
+
+@dataclass(frozen=True)
+class SeriesPanel:
+    """One subplot of :func:`plot_time_series_batch`."""
+
+    y_columns: Union[str, list]
+    title: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ForecastPanel:
+    """One subplot of :func:`plot_forecast_batch`."""
+
+    actual_column: str
+    forecast_column: str
+    title: Optional[str] = None
+
+
+def _batch_figure(
+    pyplot: ModuleType,
+    n_panels: int,
+    title: Optional[str],
+    kwargs: dict[str, Any],
+) -> tuple[Any, list]:
+    """Create one figure with ``n_panels`` stacked axes sharing the x-axis."""
+    figure_kwargs = {k: kwargs.pop(k) for k in ("figsize", "dpi") if k in kwargs}
+    fig, axes = pyplot.subplots(n_panels, 1, sharex=True, squeeze=False, **figure_kwargs)
+    if title:
+        fig.suptitle(title)
+    return fig, list(axes[:, 0])
+
+
+def _finish_batch(
+    pyplot: Optional[ModuleType],
+    fig: Any,
+    result: dict[str, Any],
+    output_path_obj: Optional[Path],
+) -> dict[str, Any]:
+    """Save a batch figure (if requested), release it and fill in ``output_path``."""
+    if output_path_obj:
+        _ensure_dir(str(output_path_obj.parent))
+        if fig is not None:
+            save_future = _submit_savefig(fig, output_path_obj)
+            if save_future is not None:
+                result["save_future"] = save_future
+        result["output_path"] = str(output_path_obj)
+    if pyplot is not None and fig is not None:
+        pyplot.close(fig)
+    return result
+
+
+def plot_time_series_batch(
+    data: pd.DataFrame,
+    x_column: Optional[str],
+    panels: Sequence[SeriesPanel],
+    title: Optional[str] = None,
+    output_path: Optional[Union[str, Path]] = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Plot several time series panels into a single figure.
+
+    Creating one figure with stacked axes and saving it once is much cheaper
+    than calling :func:`plot_time_series` per panel. Each panel is drawn with
+    plotsmith when it accepts ``ax=``, otherwise with ``ax.plot``.
+
+    Args:
+        data: DataFrame with time series data
+        x_column: Column name for x-axis, or None to use the index
+        panels: One SeriesPanel per subplot
+        title: Optional figure title
+        output_path: Optional path to save figure
+        **kwargs: Additional plotting arguments (``figsize``/``dpi`` apply to the figure)
+
+    Returns:
+        Dictionary with plot metadata, one entry per panel, and saved path if applicable
+    """
+    panel_info = [
+        {
+            "y_columns": [panel.y_columns] if isinstance(panel.y_columns, str) else panel.y_columns,
+            "title": panel.title,
+        }
+        for panel in panels
+    ]
+    result = _plot_result(
+        data,
+        {
+            "type": "time_series_batch",
+            "x_column": x_column,
+            "title": title,
+            "panels": panel_info,
+        },
+    )
+
+    pyplot = _get_pyplot()
+    fig = None
+    if pyplot is not None and panel_info:
+        width = _pixel_width(kwargs)
+        fig, axes = _batch_figure(pyplot, len(panel_info), title, kwargs)
+        plotsmith = _get_plotsmith()
+        draw = getattr(plotsmith, "plot_timeseries", None)
+        for ax, info in zip(axes, panel_info):
+            plot_data = _series_plot_data(data, x_column, info["y_columns"], width)
+            if not _draw_on_axes(draw, ax, plot_data, title=info["title"], **kwargs):
+                ax.plot(plot_data.index, plot_data.to_numpy())
+                ax.set_title(info["title"] or "")
+
+    return _finish_batch(pyplot, fig, result, Path(output_path) if output_path else None)
+
+
+def plot_forecast_batch(
+    data: pd.DataFrame,
+    timestamp_column: Optional[str],
+    panels: Sequence[ForecastPanel],
+    title: Optional[str] = None,
+    output_path: Optional[Union[str, Path]] = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Plot several actual-vs-forecast panels into a single figure.
+
+    Each panel is drawn with timesmith.plot_forecast when it accepts ``ax=``,
+    otherwise with two ``ax.plot`` calls. The figure is saved once, like
+    :func:`plot_forecast`.
+
+    Args:
+        data: DataFrame with actual and forecasted values
+        timestamp_column: Column name for timestamps, or None to use the index
+        panels: One ForecastPanel per subplot
+        title: Optional figure title
+        output_path: Optional path to save figure
+        **kwargs: Additional plotting arguments (``figsize``/``dpi`` apply to the figure)
+
+    Returns:
+        Dictionary with plot metadata, one entry per panel, and saved path if applicable
+    """
+    panel_info = [
+        {
+            "actual_column": panel.actual_column,
+            "forecast_column": panel.forecast_column,
+            "title": panel.title,
+        }
+        for panel in panels
+    ]
+    result = _plot_result(
+        data,
+        {
+            "type": "forecast_batch",
+            "timestamp_column": timestamp_column,
+            "title": title,
+            "panels": panel_info,
+        },
+    )
+
+    pyplot = _get_pyplot()
+    fig = None
+    if pyplot is not None and panel_info:
+        width = _pixel_width(kwargs)
+        fig, axes = _batch_figure(pyplot, len(panel_info), title, kwargs)
+        timesmith = _get_timesmith()
+        draw = getattr(timesmith, "plot_forecast", None)
+        for ax, info in zip(axes, panel_info):
+            historical, forecast = _forecast_plot_data(
+                data, timestamp_column, info["actual_column"], info["forecast_column"], width
+            )
+            if not _draw_on_axes(draw, ax, historical, forecast, title=info["title"], **kwargs):
+                _plot_forecast_on_axes(ax, historical, forecast, info["title"])
+
+    return _finish_batch(pyplot, fig, result, Path(output_path) if output_path else None)
+
+
+@dataclass(frozen=True)
+class ForecastSpec:
+    """One forecast figure for :func:`render_forecasts_parallel`."""
+
+    data: pd.DataFrame
+    timestamp_column: Optional[str]
+    actual_column: str
+    forecast_column: str
+    output_path: Optional[Union[str, Path]] = None
+    title: Optional[str] = None
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def _preimport_smith() -> None:
+    """Warm a render worker: import the plotting stack once and save in-process."""
+    os.environ["GRIDSMITH_SINGLECORE"] = "1"
+    _get_plotsmith()
+    _get_timesmith()
+    _get_pyplot()
+
+
+def _render_one_forecast(spec: ForecastSpec) -> dict[str, Any]:
+    """Render a single ForecastSpec and return picklable plot metadata."""
+    result = plot_forecast(
+        spec.data,
+        spec.timestamp_column,
+        spec.actual_column,
+        spec.forecast_column,
+        title=spec.title,
+        output_path=spec.output_path,
+        cache=False,
+        **spec.kwargs,
+    )
+    return {**result, "data_shape": result["data_shape"]}
+
+
+def _trim_spec(spec: ForecastSpec) -> ForecastSpec:
+    """Return ``spec`` holding only the columns it plots, to keep worker pickles small."""
+    columns = [
+        column
+        for column in (spec.timestamp_column, spec.actual_column, spec.forecast_column)
+        if column is not None and column in spec.data.columns
+    ]
+    return replace(spec, data=spec.data[columns])
+
+
+def render_forecasts_parallel(
+    specs: Sequence[ForecastSpec], n_jobs: int = -1
+) -> list[dict[str, Any]]:
+    """Render many forecast figures across worker processes.
+
+    Each worker imports plotsmith/timesmith (and warms matplotlib) once, then
+    renders and saves its share of the specs. Workers are spawned, since
+    matplotlib is not thread-safe, and receive only the columns each spec plots.
+
+    Args:
+        specs: Forecast figures to render
+        n_jobs: Number of worker processes; -1 (or 0) uses every core, 1 renders
+            in this process. GRIDSMITH_SINGLECORE also forces in-process rendering.
+
+    Returns:
+        One plot metadata dictionary per spec, in order
+    """
+    shapes = [spec.data.shape for spec in specs]
+    trimmed = [_trim_spec(spec) for spec in specs]
+    n_workers = min(n_jobs if n_jobs > 0 else os.cpu_count() or 1, len(trimmed))
+
+    if n_workers <= 1 or os.environ.get("GRIDSMITH_SINGLECORE"):
+        results = [_render_one_forecast(spec) for spec in trimmed]
+    else:
+        # Up to 4 specs per task, without leaving workers idle on short lists
+        chunksize = max(1, min(4, len(trimmed) // n_workers))
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_preimport_smith,
+        ) as executor:
+            results = list(executor.map(_render_one_forecast, trimmed, chunksize=chunksize))
+
+    for result, shape in zip(results, shapes):
+        result["data_shape"] = shape
+    return results
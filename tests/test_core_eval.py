@@ -0,0 +1,131 @@
+"""Tests for core evaluation module."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gridsmith.core.eval import compute_anomaly_metrics, compute_regression_metrics
+
+
+def test_regression_metrics_values():
+    """Test regression metrics against hand-computed values."""
+    actual = pd.Series([1.0, 2.0, 4.0, 0.0])
+    predicted = pd.Series([2.0, 2.0, 2.0, 1.0])
+
+    metrics = compute_regression_metrics(actual, predicted)
+
+    assert metrics["mse"] == pytest.approx(1.5)
+    assert metrics["mae"] == pytest.approx(1.0)
+    assert metrics["rmse"] == pytest.approx(math.sqrt(1.5))
+    # Zero actuals are excluded from MAPE
+    assert metrics["mape"] == pytest.approx((100.0 + 0.0 + 50.0) / 3)
+
+
+def test_regression_metrics_skips_missing_pairs():
+    """Test NaN pairs are ignored, as pandas arithmetic did."""
+    actual = pd.Series([1.0, np.nan, 3.0])
+    predicted = pd.Series([2.0, 5.0, 3.0])
+
+    metrics = compute_regression_metrics(actual, predicted, metrics=["mse", "mae"])
+
+    assert metrics == {"mse": pytest.approx(0.5), "mae": pytest.approx(0.5)}
+
+
+def test_regression_metrics_numba_kernel_matches_numpy(monkeypatch):
+    """Test the JIT kernel used for large inputs agrees with the NumPy path."""
+    from gridsmith.core import eval as eval_module
+
+    if eval_module._reg_kernel is None:
+        pytest.skip("numba not installed")
+
+    rng = np.random.default_rng(0)
+    actual = pd.Series(rng.normal(10, 2, 20_000))
+    actual[::7] = 0.0
+    predicted = pd.Series(rng.normal(10, 2, 20_000))
+
+    jit_metrics = compute_regression_metrics(actual, predicted)
+    monkeypatch.setattr(eval_module, "_reg_kernel", None)
+    numpy_metrics = compute_regression_metrics(actual, predicted)
+
+    assert jit_metrics == pytest.approx(numpy_metrics)
+
+
+def test_anomaly_metrics_match_sklearn():
+    """Test confusion-matrix based metrics agree with scikit-learn."""
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+
+    rng = np.random.default_rng(1)
+    actual = pd.Series(rng.random(200) < 0.2)
+    predicted = pd.Series(rng.random(200) < 0.3)
+
+    metrics = compute_anomaly_metrics(
+        actual, predicted, metrics=["accuracy", "precision", "recall", "f1"]
+    )
+
+    assert metrics["accuracy"] == pytest.approx(accuracy_score(actual, predicted))
+    assert metrics["precision"] == pytest.approx(precision_score(actual, predicted))
+    assert metrics["recall"] == pytest.approx(recall_score(actual, predicted))
+    assert metrics["f1"] == pytest.approx(f1_score(actual, predicted))
+
+
+def test_anomaly_metrics_zero_division():
+    """Test metrics are 0.0 when there are no predicted or actual positives."""
+    labels = pd.Series([False, False, False])
+
+    assert compute_anomaly_metrics(labels, labels) == {
+        "precision": 0.0,
+        "recall": 0.0,
+        "f1": 0.0,
+    }
+
+
+@pytest.mark.parametrize("bad", [[0, 1, 2], [0, -1, 1]])
+def test_anomaly_metrics_reject_non_binary_labels(bad):
+    """Test labels outside {0, 1} raise a clear ValueError."""
+    with pytest.raises(ValueError, match="must be 0/1"):
+        compute_anomaly_metrics(pd.Series(bad), pd.Series([0, 1, 1]))
+
+
+def test_regression_metrics_timesmith_failure_falls_back(monkeypatch):
+    """Test a failing timesmith metric falls back to local computation."""
+    from gridsmith.core import eval as eval_module
+
+    def failing_mae(actual, predicted):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(eval_module, "_TIMESMITH_FUNCS", {"mae": failing_mae})
+
+    metrics = compute_regression_metrics(
+        pd.Series([1.0, 2.0]), pd.Series([2.0, 2.0]), metrics=["mae"]
+    )
+
+    assert metrics == {"mae": pytest.approx(0.5)}
+
+
+def test_anomaly_metrics_anomsmith_failure_falls_back(monkeypatch):
+    """Test a failing anomsmith entry point warns and falls back locally."""
+    from gridsmith.core import eval as eval_module
+
+    def failing_compute(actual, predicted, scores, metrics):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(eval_module, "_ANOMSMITH_COMPUTE", failing_compute)
+
+    with pytest.warns(UserWarning, match="boom"):
+        metrics = compute_anomaly_metrics(
+            pd.Series([0, 1, 1]), pd.Series([0, 1, 0]), metrics=["precision"]
+        )
+
+    assert metrics == {"precision": pytest.approx(1.0)}
+
+
+def test_regression_metrics_accept_arrays():
+    """Test NumPy arrays give the same metrics as Series."""
+    actual = np.array([1.0, 2.0, 3.0])
+    predicted = np.array([1.5, 2.0, 2.0])
+
+    assert compute_regression_metrics(actual, predicted) == compute_regression_metrics(
+        pd.Series(actual), pd.Series(predicted)
+    )
@@ -0,0 +1,266 @@
+"""Tests for core I/O module."""
+
+import json
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+import yaml
+
+from gridsmith.core import io
+
+
+def test_load_yaml_matches_safe_load(tmp_path):
+    """Test load_yaml produces the same structure as yaml.safe_load."""
+    text = (
+        "input_path: data.csv\n"
+        "horizon: 24\n"
+        "ratio: 0.2\n"
+        "enabled: true\n"
+        "missing: ~\n"
+        'quoted: "42"\n'
+        "metadata:\n"
+        "  tags: [a, b]\n"
+    )
+    path = tmp_path / "config.yaml"
+    path.write_text(text)
+
+    assert io.load_yaml(path) == yaml.safe_load(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "0x10",
+        "-0x1F",
+        "012",
+        "0b101",
+        "1:30",
+        "190:20:30.15",
+        "2024-01-01",
+        "1e3",
+        "on",
+        "-.5",
+        "+.5",
+        "._",
+        ".e+5",
+        ".5",
+        "1._",
+    ],
+)
+def test_resolve_plain_scalar_matches_safe_load(text):
+    """Test rapidyaml scalars resolve like safe_load, including YAML 1.1 int forms."""
+    assert io._resolve_plain_scalar(text) == yaml.safe_load(text)
+
+
+def test_load_yaml_pyyaml_fallback(tmp_path, monkeypatch):
+    """Test load_yaml falls back to PyYAML when rapidyaml is unavailable."""
+    monkeypatch.setattr(io, "HAS_RYML", False)
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\nb: [x, y]\n")
+
+    assert io.load_yaml(path) == {"a": 1, "b": ["x", "y"]}
+
+
+def test_load_yaml_empty_file(tmp_path):
+    """Test load_yaml returns None for an empty document."""
+    path = tmp_path / "empty.yaml"
+    path.write_text("")
+
+    assert io.load_yaml(path) is None
+
+
+def test_load_parquet_projection_and_timestamp(tmp_path):
+    """Test load_parquet pushes down columns and parses the timestamp column."""
+    path = tmp_path / "data.parquet"
+    pd.DataFrame(
+        {
+            "timestamp": ["2024-01-01 00:00", "2024-01-01 01:00"],
+            "consumption": [1.0, 2.0],
+            "meter_id": ["m1", "m2"],
+        }
+    ).to_parquet(path)
+
+    df = io.load_parquet(
+        path, timestamp_column="timestamp", columns=["timestamp", "consumption"]
+    )
+
+    assert list(df.columns) == ["timestamp", "consumption"]
+    assert pd.api.types.is_datetime64_any_dtype(df["timestamp"])
+    assert df["consumption"].tolist() == [1.0, 2.0]
+
+
+def test_load_csv_timestamp_format(tmp_path):
+    """Test load_csv parses timestamps with explicit and sniffed formats."""
+    path = tmp_path / "data.csv"
+    path.write_text("timestamp,consumption\n01/02/2024 10:00,1.0\n01/03/2024 11:00,2.0\n")
+
+    df = io.load_csv(path, timestamp_column="timestamp", timestamp_format="%m/%d/%Y %H:%M")
+    assert df["timestamp"].iloc[0] == pd.Timestamp("2024-01-02 10:00")
+
+    assert io._sniff_timestamp_format(pd.Series([None, "2024-01-01T00:00:00"])) == "ISO8601"
+    assert io._sniff_timestamp_format(pd.Series(["01/02/2024 10:00"])) is None
+
+
+@pytest.mark.parametrize(
+    ("text", "kwargs"),
+    [
+        ("# meter export\nconsumption,demand\n1.0,2.0\n", {"comment": "#"}),
+        ("consumption  demand\n1.0   2.0\n", {"sep": r"\s+"}),
+        ("consumption::demand\n1.0::2.0\n", {"sep": "::"}),
+    ],
+)
+def test_load_csv_falls_back_from_pyarrow(tmp_path, text, kwargs):
+    """Test options the pyarrow engine rejects are read with the C/python engine."""
+    path = tmp_path / "data.csv"
+    path.write_text(text)
+
+    df = io.load_csv(path, **kwargs)
+
+    assert df.to_dict("list") == {"consumption": [1.0], "demand": [2.0]}
+
+
+def test_save_dataframe_chunked_parquet_roundtrip(tmp_path):
+    """Test large parquet saves are streamed in row groups without data loss."""
+    path = tmp_path / "out.parquet"
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=1000, freq="h"),
+            "consumption": [float(i) for i in range(1000)],
+        }
+    )
+
+    io.save_dataframe(df, path, format="parquet", chunk_rows=256)
+
+    assert pq.ParquetFile(path).metadata.num_row_groups == 4
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+
+
+@pytest.mark.parametrize("extra", [{}, {"partition_cols": None}])
+def test_save_dataframe_row_group_size_is_honoured(tmp_path, extra):
+    """Test row_group_size sets row groups on both the streaming and to_parquet paths."""
+    path = tmp_path / "out.parquet"
+    df = pd.DataFrame({"consumption": [float(i) for i in range(10)]})
+
+    io.save_dataframe(df, path, row_group_size=3, **extra)
+
+    assert pq.ParquetFile(path).metadata.num_row_groups == 4
+
+
+@pytest.mark.parametrize("index", [None, True, False])
+def test_save_dataframe_chunked_parquet_matches_to_parquet(tmp_path, index):
+    """Test chunked and single-shot parquet saves accept the same options and agree."""
+    df = pd.DataFrame(
+        {"consumption": [float(i) for i in range(1000)]},
+        index=pd.date_range("2024-01-01", periods=1000, freq="h", name="timestamp"),
+    )
+    chunked, whole = tmp_path / "chunked.parquet", tmp_path / "whole.parquet"
+
+    io.save_dataframe(df, chunked, chunk_rows=256, index=index)
+    io.save_dataframe(df, whole, chunk_rows=10_000, index=index)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(chunked), pd.read_parquet(whole))
+    compressions = {
+        pq.ParquetFile(path).metadata.row_group(0).column(0).compression
+        for path in (chunked, whole)
+    }
+    assert compressions == {"SNAPPY"}
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_save_json_roundtrip(tmp_path, monkeypatch, has_orjson):
+    """Test save_json writes readable JSON with and without orjson."""
+    if has_orjson and io.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(io, "HAS_ORJSON", has_orjson)
+    path = tmp_path / "metrics.json"
+
+    io.save_json({"precision": 0.5, "recall": 1.0}, path)
+
+    assert json.loads(path.read_text()) == {"precision": 0.5, "recall": 1.0}
+
+
+def test_load_parquet_many_concatenates_shards(tmp_path):
+    """Test load_parquet_many reads shards in order as one DataFrame."""
+    paths = []
+    for day in range(3):
+        path = tmp_path / f"day={day}.parquet"
+        pd.DataFrame(
+            {
+                "timestamp": pd.date_range(f"2024-01-0{day + 1}", periods=2, freq="h"),
+                "consumption": [float(day), float(day)],
+            }
+        ).to_parquet(path)
+        paths.append(path)
+
+    df = io.load_parquet_many(paths, timestamp_column="timestamp", columns=["consumption"])
+
+    assert len(df) == 6
+    assert df["consumption"].tolist() == [0.0, 0.0, 1.0, 1.0, 2.0, 2.0]
+
+
+@pytest.mark.parametrize("scale", [1, 1_000])
+def test_load_csv_integer_epoch_timestamps(tmp_path, scale):
+    """Test integer epoch seconds and milliseconds are converted with the right unit."""
+    path = tmp_path / "data.csv"
+    path.write_text(f"timestamp,consumption\n{1704067200 * scale},1.0\n{1704070800 * scale},2.0\n")
+
+    df = io.load_csv(path, timestamp_column="timestamp")
+
+    assert df["timestamp"].tolist() == [
+        pd.Timestamp("2024-01-01 00:00"),
+        pd.Timestamp("2024-01-01 01:00"),
+    ]
+
+
+def test_load_csv_memory_mapped(tmp_path, monkeypatch):
+    """Test the memory-mapped CSV path returns the same frame."""
+    path = tmp_path / "data.csv"
+    path.write_text("timestamp,consumption\n2024-01-01,1.0\n2024-01-02,2.0\n")
+    expected = io.load_csv(path, timestamp_column="timestamp")
+
+    monkeypatch.setattr(io, "CSV_MMAP_MIN_BYTES", 0)
+    df = io.load_csv(path, timestamp_column="timestamp")
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert df["timestamp"].iloc[1] == pd.Timestamp("2024-01-02")
+
+
+def test_save_json_rounds_floats(tmp_path):
+    """Test save_json keeps six significant digits by default."""
+    path = tmp_path / "metrics.json"
+
+    io.save_json({"mse": 1234.56789123, "nested": {"f1": [0.123456789]}}, path)
+    assert json.loads(path.read_text()) == {"mse": 1234.57, "nested": {"f1": [0.123457]}}
+
+    io.save_json({"mse": 1234.56789123}, path, float_digits=None)
+    assert json.loads(path.read_text()) == {"mse": 1234.56789123}
+
+
+def test_save_dataframe_json_matches_to_json(tmp_path, monkeypatch):
+    """Test the chunked orjson writer produces the same records as df.to_json."""
+    if io.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(io, "JSON_CHUNK_ROWS", 3)
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=7, freq="h"),
+            "consumption": [1.0, None, 3.0, 4.0, 5.0, 6.0, 7.0],
+        }
+    )
+    path = tmp_path / "out.json"
+
+    io.save_dataframe(df, path, format="json")
+
+    assert json.loads(path.read_text()) == json.loads(df.to_json(orient="records"))
+
+
+def test_save_dataframe_row_group_size_alias(tmp_path):
+    """Test row_group_size streams row groups instead of reaching ParquetWriter."""
+    path = tmp_path / "out.parquet"
+    df = pd.DataFrame({"consumption": [float(i) for i in range(100)]})
+
+    io.save_dataframe(df, path, row_group_size=30, compression="lz4")
+
+    assert pq.ParquetFile(path).metadata.num_row_groups == 4
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
@@ -0,0 +1,302 @@
+"""Tests for core pipeline helpers."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gridsmith.core import pipelines
+
+
+def _write_csv(path, n=5):
+    pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="h"),
+            "consumption": np.arange(n, dtype=float),
+            "meter_id": ["m1"] * n,
+        }
+    ).to_csv(path, index=False)
+
+
+def test_load_dataframe_csv_sidecar(tmp_path):
+    """Test CSV loads are served from a parquet sidecar until the CSV changes."""
+    path = tmp_path / "data.csv"
+    _write_csv(path)
+
+    first = pipelines._load_dataframe(path)
+    sidecar = pipelines._csv_sidecar(path)
+    assert sidecar.exists()
+
+    second = pipelines._load_dataframe(path, columns=["timestamp", "consumption"])
+    assert list(second.columns) == ["timestamp", "consumption"]
+    pd.testing.assert_frame_equal(second, first[["timestamp", "consumption"]])
+
+    _write_csv(path, n=7)
+    os.utime(path, ns=(0, sidecar.stat().st_mtime_ns + 1))
+    assert len(pipelines._load_dataframe(path)) == 7
+
+
+def test_load_dataframe_projects_existing_columns(tmp_path):
+    """Test requested columns are pushed down and missing ones are ignored."""
+    path = tmp_path / "data.parquet"
+    pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=3, freq="h"),
+            "consumption": [1.0, 2.0, 3.0],
+            "meter_id": ["m1"] * 3,
+        }
+    ).to_parquet(path)
+
+    df = pipelines._load_dataframe(path, columns=["consumption", "timestamp", "ground_truth"])
+
+    assert list(df.columns) == ["timestamp", "consumption"]
+
+
+def test_needed_columns_projects_only_with_dataset_spec():
+    """Test inputs are read whole unless a dataset spec declares the columns."""
+    config = pipelines.Config(input_path="", output_dir="")
+    assert pipelines._needed_columns(config, "timestamp", "consumption") is None
+
+    config.dataset_spec = pipelines.DatasetSpec(
+        name="ami", required_columns=["consumption"], id_column="meter_id"
+    )
+    assert pipelines._needed_columns(config, "timestamp") == [
+        "consumption",
+        "meter_id",
+        "timestamp",
+    ]
+
+
+def test_compute_zscore_anomalies_matches_pandas():
+    """Test z-scores use sample std and flag values beyond two deviations."""
+    df = pd.DataFrame({"consumption": [10.0, 11.0, 9.0, 10.0, 30.0, 10.5]})
+    config = pipelines.Config(input_path="", output_dir="")
+
+    result = pipelines._compute_zscore_anomalies(df, "consumption", config)
+
+    expected = ((df["consumption"] - df["consumption"].mean()) / df["consumption"].std()).abs()
+    np.testing.assert_allclose(result["anomaly_score"], expected)
+    assert result["is_anomaly"].tolist() == (expected > 2.0).tolist()
+
+
+def test_temperature_load_pipeline_recovers_slope(tmp_path):
+    """Test the closed-form fit recovers the temperature coefficient."""
+    rng = np.random.default_rng(0)
+    temperature = rng.normal(20.0, 5.0, 200)
+    path = tmp_path / "temperature.csv"
+    pd.DataFrame(
+        {
+            "Date": pd.date_range("2024-01-01", periods=200, freq="D"),
+            "Temperature_C": temperature,
+            "Load_MW": 1000.0 + 10.0 * temperature,
+        }
+    ).to_csv(path, index=False)
+
+    results = pipelines.run_temperature_load_pipeline(
+        pipelines.Config(input_path=str(path), output_dir=str(tmp_path / "out"))
+    )
+
+    assert abs(results.metadata["model_coefficient"] - 10.0) < 1e-9
+    assert results.metrics["mae"] < 1e-6
+
+
+def test_load_dataframe_cache_returns_copies(tmp_path):
+    """Test repeat loads of an unchanged file hit the cache and return copies."""
+    path = tmp_path / "data.csv"
+    _write_csv(path)
+
+    first = pipelines._load_dataframe(path)
+    hits = pipelines._load_dataframe_cached.cache_info().hits
+    first["extra"] = 1.0
+    second = pipelines._load_dataframe(path)
+
+    assert pipelines._load_dataframe_cached.cache_info().hits == hits + 1
+    assert "extra" not in second.columns
+
+
+def test_compute_zscore_anomalies_arrow_column_with_nulls():
+    """Test Arrow-backed columns with nulls score as NaN and are not flagged."""
+    df = pd.DataFrame(
+        {"consumption": pd.array([10.0, None, 9.0, 11.0, 10.0], dtype="double[pyarrow]")}
+    )
+    config = pipelines.Config(input_path="", output_dir="")
+
+    result = pipelines._compute_zscore_anomalies(df, "consumption", config)
+
+    assert np.isnan(result["anomaly_score"].iloc[1])
+    assert not result["is_anomaly"].any()
+
+
+def test_synthetic_hourly_load_matches_formula():
+    """Test the fused generator reproduces the seasonal and daily load formula."""
+    metadata = {"periods": 48, "random_state": 7}
+
+    df = pipelines._synthetic_hourly_load(metadata)
+
+    dates = pd.date_range("2024-01-01", periods=48, freq="h")
+    noise = np.random.default_rng(7).normal(0, 20.0, 48)
+    expected = (
+        1000.0
+        + 200.0 * np.sin(2 * np.pi * dates.dayofyear / 365)
+        + 150.0 * np.sin(2 * np.pi * dates.hour / 24)
+        + noise
+    )
+    np.testing.assert_allclose(df["Load_MW"], expected)
+    assert (df["timestamp"] == dates).all()
+
+
+def test_temperature_load_pipeline_synthetic(tmp_path):
+    """Test the temperature pipeline runs on generated data when no input exists."""
+    results = pipelines.run_temperature_load_pipeline(
+        pipelines.Config(
+            input_path="", output_dir=str(tmp_path), metadata={"days": 60}
+        )
+    )
+
+    assert results.metadata["input_shape"] == (60, 5)
+    assert set(results.metrics) == {"mse", "mae", "coefficient"}
+
+
+def test_try_timesmith_forecast_uses_resolved_forecaster(monkeypatch):
+    """Test a resolved forecaster class is fitted and its forecast appended."""
+
+    class FakeForecaster:
+        def fit(self, y):
+            self.last = float(y.iloc[-1])
+
+        def predict(self, horizon):
+            return pd.Series([self.last] * horizon)
+
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=4, freq="h"),
+            "Load_MW": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    monkeypatch.setattr(pipelines, "_TS_FORECAST_FN", None)
+    monkeypatch.setattr(pipelines, "_TS_FORECASTER_CLASSES", {"FakeForecaster": FakeForecaster})
+
+    result, success = pipelines._try_timesmith_forecast(df, "Load_MW", "timestamp", 2)
+
+    assert success
+    assert result["forecast"].iloc[-2:].tolist() == [4.0, 4.0]
+    assert result["timestamp"].iloc[-1] == pd.Timestamp("2024-01-01 05:00")
+
+
+def test_try_anomsmith_detection_without_anomsmith(monkeypatch):
+    """Test detection returns the frame unchanged when anomsmith is unavailable."""
+    monkeypatch.setattr(pipelines, "_ANOM_DETECT_FN", None)
+    monkeypatch.setattr(pipelines, "_ANOM_DETECTOR_CLS", None)
+    df = pd.DataFrame({"consumption": [1.0, 2.0]})
+
+    assert pipelines._try_anomsmith_detection(df, "consumption") is df
+
+
+def test_predictive_maintenance_isolation_forest_fallback(tmp_path):
+    """Test the IsolationForest fallback adds anomaly labels and scores."""
+    rng = np.random.default_rng(1)
+    path = tmp_path / "sensors.csv"
+    pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=100, freq="h"),
+            "Temperature_C": rng.normal(60.0, 5.0, 100),
+            "Vibration_g": rng.normal(1.0, 0.1, 100),
+        }
+    ).to_csv(path, index=False)
+
+    results = pipelines.run_predictive_maintenance_pipeline(
+        pipelines.Config(input_path=str(path), output_dir=str(tmp_path / "out"))
+    )
+
+    table = pd.read_parquet(results.tables["predictive_maintenance_results"])
+    assert {"is_anomaly", "anomaly_score"}.issubset(table.columns)
+    assert results.metadata["anomaly_count"] == 10
+
+
+def test_try_anomsmith_detection_labels_from_scores(monkeypatch):
+    """Test detectors exposing offset_ are labelled from scores without predict."""
+
+    class FakeDetector:
+        offset_ = -0.5
+
+        def fit(self, x):
+            return self
+
+        def score_samples(self, x):
+            return -x.iloc[:, 0].to_numpy()
+
+        def predict(self, x):
+            raise AssertionError("predict should not be called")
+
+    monkeypatch.setattr(pipelines, "_ANOM_DETECT_FN", None)
+    monkeypatch.setattr(pipelines, "_ANOM_DETECTOR_CLS", FakeDetector)
+    df = pd.DataFrame({"consumption": [0.1, 0.9, 0.2]})
+
+    result = pipelines._try_anomsmith_detection(df, "consumption")
+
+    assert result["is_anomaly"].tolist() == [False, True, False]
+
+
+def test_split_positions_partitions_rows():
+    """Test the permutation split is disjoint, complete, and seeded."""
+    train, test = pipelines._split_positions(10, 0.25, 42)
+
+    assert len(test) == 3
+    assert sorted(np.concatenate([train, test]).tolist()) == list(range(10))
+    np.testing.assert_array_equal(train, pipelines._split_positions(10, 0.25, 42)[0])
+
+    assert len(pipelines._split_positions(10, 4, 42)[1]) == 4
+    with pytest.raises(ValueError, match="test_size"):
+        pipelines._split_positions(10, 10, 42)
+    with pytest.raises(ValueError, match="test_size"):
+        pipelines._split_positions(10, 1.5, 42)
+
+
+def test_outage_prediction_pipeline_synthetic(tmp_path):
+    """Test the outage pipeline trains on generated data and reports metrics."""
+    results = pipelines.run_outage_prediction_pipeline(
+        pipelines.Config(
+            input_path="",
+            output_dir=str(tmp_path),
+            metadata={"samples": 300, "n_estimators": 10},
+        )
+    )
+
+    assert set(results.metrics) == {"roc_auc", "precision", "recall", "f1"}
+    assert (tmp_path / "tables" / "feature_importance.parquet").exists()
+
+
+def test_compute_zscore_anomalies_numba_kernel_matches_numpy(monkeypatch):
+    """Test the Numba z-score kernel agrees with the NumPy path."""
+    if pipelines._zscore_kernel is None:
+        pytest.skip("numba not installed")
+    values = np.random.default_rng(0).normal(100.0, 10.0, 1_000)
+    values[5] = np.nan
+    config = pipelines.Config(input_path="", output_dir="")
+
+    monkeypatch.setattr(pipelines, "ZSCORE_NUMBA_MIN_ROWS", 0)
+    jit = pipelines._compute_zscore_anomalies(pd.DataFrame({"v": values}), "v", config)
+    monkeypatch.setattr(pipelines, "_zscore_kernel", None)
+    ref = pipelines._compute_zscore_anomalies(pd.DataFrame({"v": values}), "v", config)
+
+    np.testing.assert_allclose(jit["anomaly_score"], ref["anomaly_score"])
+    assert jit["is_anomaly"].tolist() == ref["is_anomaly"].tolist()
+
+
+def test_predictive_maintenance_named_index_is_plotted_as_timestamp(tmp_path):
+    """Test a stored timestamp index is reset once and used as the plot axis."""
+    rng = np.random.default_rng(2)
+    path = tmp_path / "sensors.parquet"
+    pd.DataFrame(
+        {"Temperature_C": rng.normal(60.0, 5.0, 50)},
+        index=pd.date_range("2024-01-01", periods=50, freq="h", name="timestamp"),
+    ).to_parquet(path)
+
+    results = pipelines.run_predictive_maintenance_pipeline(
+        pipelines.Config(input_path=str(path), output_dir=str(tmp_path / "out"))
+    )
+
+    table = pd.read_parquet(results.tables["predictive_maintenance_results"])
+    assert table.columns[0] == "timestamp"
+    assert "anomaly_plot" in results.figures
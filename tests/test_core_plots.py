@@ -0,0 +1,457 @@
+"""Tests for core plotting wrappers."""
+
+import shutil
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gridsmith.core import plots
+
+
+@pytest.fixture(autouse=True)
+def _fresh_plot_cache(tmp_path, monkeypatch):
+    """Keep memoized renders in a per-test directory and apart between tests."""
+    monkeypatch.setattr(plots, "_PLOT_CACHE_DIR", tmp_path / "plot-cache")
+    plots.clear_plot_cache()
+    yield
+    plots.clear_plot_cache()
+
+
+@pytest.fixture
+def frame():
+    """Small hourly frame with actual and forecast columns."""
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=6, freq="h"),
+            "load": [1.0, 2.0, 3.0, 4.0, np.nan, np.nan],
+            "forecast": [np.nan, np.nan, np.nan, 4.0, 5.0, 6.0],
+        }
+    )
+
+
+class FakeFigure:
+    """Picklable figure stand-in that writes its label to disk."""
+
+    def __init__(self, label):
+        self.label = label
+
+    def savefig(self, path):
+        with open(path, "w") as f:
+            f.write(self.label)
+
+
+@pytest.fixture
+def fake_timesmith(monkeypatch):
+    """Install a timesmith stand-in returning picklable figures."""
+    calls = []
+
+    def plot_forecast(historical, forecast, title=None, **kwargs):
+        calls.append({"historical": historical, "forecast": forecast, "title": title, **kwargs})
+        return FakeFigure(title), None
+
+    module = types.SimpleNamespace(plot_forecast=plot_forecast, calls=calls)
+    monkeypatch.setattr(plots, "_get_timesmith", lambda: module)
+    return module
+
+
+@pytest.fixture
+def fake_plotsmith(monkeypatch):
+    """Install a plotsmith stand-in that records its calls."""
+    calls = []
+
+    def plot_timeseries(data, title=None, save_path=None, **kwargs):
+        calls.append({"data": data, "title": title, "save_path": save_path, **kwargs})
+        if save_path:
+            with open(save_path, "wb") as f:
+                f.write(b"png-%d" % len(calls))
+
+    module = types.SimpleNamespace(plot_timeseries=plot_timeseries, calls=calls)
+    monkeypatch.setattr(plots, "_get_plotsmith", lambda: module)
+    return module
+
+
+def test_smith_libraries_imported_lazily(monkeypatch):
+    """Test missing plotting libraries are looked up once and fall back to metadata."""
+    plots._get_plotsmith.cache_clear()
+    imported = []
+
+    def fake_import(name):
+        imported.append(name)
+        raise ImportError(name)
+
+    monkeypatch.setattr(plots.importlib, "import_module", fake_import)
+    try:
+        assert plots._get_plotsmith() is None
+        assert plots._get_plotsmith() is None
+    finally:
+        plots._get_plotsmith.cache_clear()
+
+    assert imported == ["plotsmith"]
+
+
+def test_plot_time_series_uses_plotsmith(frame, fake_plotsmith, tmp_path):
+    """Test plot_time_series hands a timestamp-indexed Series to plotsmith."""
+    output = tmp_path / "figs" / "load.png"
+
+    result = plots.plot_time_series(frame, "timestamp", "load", output_path=output)
+
+    (call,) = fake_plotsmith.calls
+    assert call["save_path"] == str(output)
+    assert list(call["data"].index) == list(frame["timestamp"])
+    assert call["data"].index.name == "timestamp"
+    assert call["data"].name == "load"
+    assert result["output_path"] == str(output)
+    assert output.parent.is_dir()
+
+
+def test_plot_time_series_memoizes_renders(frame, fake_plotsmith, tmp_path):
+    """Test identical calls copy the cached figure instead of rerendering."""
+    first = tmp_path / "first.png"
+    second = tmp_path / "second.png"
+
+    plots.plot_time_series(frame, "timestamp", "load", output_path=first, cache=True)
+    result = plots.plot_time_series(frame, "timestamp", "load", output_path=second, cache=True)
+
+    assert len(fake_plotsmith.calls) == 1
+    assert result["output_path"] == str(second)
+    assert second.read_bytes() == first.read_bytes()
+
+    plots.plot_time_series(frame, "timestamp", "load", output_path=second)
+    changed = frame.assign(load=frame["load"] * 2)
+    plots.plot_time_series(changed, "timestamp", "load", output_path=second, cache=True)
+    assert len(fake_plotsmith.calls) == 3
+
+
+def test_plot_cache_is_opt_in_and_process_local(frame, fake_plotsmith, tmp_path, monkeypatch):
+    """Test renders are not memoized by default and cached figures go to a temp dir."""
+    monkeypatch.setattr(plots, "_PLOT_CACHE_DIR", None)
+    for _ in range(2):
+        plots.plot_time_series(frame, "timestamp", "load", output_path=tmp_path / "a.png")
+    assert len(fake_plotsmith.calls) == 2
+    assert plots._PLOT_CACHE == {}
+
+    plots.plot_time_series(frame, "timestamp", "load", output_path=tmp_path / "a.png", cache=True)
+    cache_dir = plots._plot_cache_dir()
+    assert cache_dir.name.startswith("gridsmith-plots-")
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_m4_aggregate_keeps_extremes_and_endpoints():
+    """Test M4 aggregation keeps each bucket's first, last, min and max points."""
+    rng = np.random.default_rng(3)
+    series = pd.Series(
+        rng.normal(size=10_000), index=pd.date_range("2024-01-01", periods=10_000, freq="min")
+    )
+    series.iloc[1234] = 50.0
+    series.iloc[4321] = np.nan
+
+    reduced = plots._m4_aggregate(series, width=100)
+
+    assert len(reduced) <= 4 * 2 * 100
+    assert reduced.index.is_monotonic_increasing
+    assert reduced.index[0] == series.index[0]
+    assert reduced.index[-1] == series.index[-1]
+    assert reduced.max() == 50.0
+    assert reduced.min() == series.min()
+    assert len(plots._m4_aggregate(series.iloc[:400], width=100)) == 400
+
+    unsorted = series.set_axis(rng.normal(size=10_000))
+    assert plots._m4_aggregate(unsorted, width=100) is unsorted
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_plot_forecast_saves_in_background_on_request(
+    frame, fake_timesmith, tmp_path, monkeypatch, background
+):
+    """Test plot_forecast saves synchronously unless GRIDSMITH_BACKGROUND_SAVE is set."""
+    if background:
+        monkeypatch.setenv("GRIDSMITH_BACKGROUND_SAVE", "1")
+    output = tmp_path / "forecast.png"
+
+    result = plots.plot_forecast(
+        frame, "timestamp", "load", "forecast", title="Load", output_path=output
+    )
+    if not background:
+        assert output.read_text() == "Load"
+    plots.flush()
+
+    assert ("save_future" in result) is background
+    assert output.read_text() == "Load"
+    (call,) = fake_timesmith.calls
+    assert call["historical"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert call["forecast"].tolist() == [4.0, 5.0, 6.0]
+
+
+class FakeAxes:
+    """Axes stand-in recording plotted lines."""
+
+    def __init__(self):
+        self.lines = []
+        self.title = None
+
+    def plot(self, x, y, label=None):
+        self.lines.append((label, list(y)))
+
+    def set_title(self, title):
+        self.title = title
+
+    def legend(self):
+        pass
+
+
+def test_plot_forecast_batch_draws_one_figure(frame, tmp_path, monkeypatch):
+    """Test batch forecasts share one figure and a single save."""
+    monkeypatch.setenv("GRIDSMITH_SINGLECORE", "1")
+    monkeypatch.setattr(plots, "_get_timesmith", lambda: None)
+    figures = []
+
+    def subplots(nrows, ncols, sharex, squeeze):
+        fig = FakeFigure("batch")
+        fig.suptitle = lambda title: None
+        fig.axes = np.array([[FakeAxes()] for _ in range(nrows)], dtype=object)
+        figures.append(fig)
+        return fig, fig.axes
+
+    pyplot = types.SimpleNamespace(subplots=subplots, close=lambda fig: None)
+    monkeypatch.setattr(plots, "_get_pyplot", lambda: pyplot)
+    output = tmp_path / "batch.png"
+
+    result = plots.plot_forecast_batch(
+        frame.assign(load2=frame["load"] * 2),
+        "timestamp",
+        [
+            plots.ForecastPanel("load", "forecast", title="A"),
+            plots.ForecastPanel("load2", "forecast", title="B"),
+        ],
+        output_path=output,
+    )
+
+    (fig,) = figures
+    top, bottom = fig.axes[:, 0]
+    assert top.title == "A"
+    assert top.lines == [("load", [1.0, 2.0, 3.0, 4.0]), ("forecast", [4.0, 5.0, 6.0])]
+    assert bottom.lines[0] == ("load2", [2.0, 4.0, 6.0, 8.0])
+    assert [panel["title"] for panel in result["panels"]] == ["A", "B"]
+    assert output.read_text() == "batch"
+
+
+def test_lazy_plot_result_defers_data_shape(frame, monkeypatch):
+    """Test GRIDSMITH_LAZY_RESULTS results compute data_shape on first read."""
+    monkeypatch.setattr(plots, "_LAZY_RESULTS", True)
+
+    result = plots.plot_anomalies(frame, "timestamp", "load", "forecast", output_path=None)
+
+    assert isinstance(result, plots.PlotResult)
+    assert "data_shape" not in dict(result)
+    assert "data_shape" in result
+    assert result.get("output_path") is None
+    assert result["data_shape"] == (6, 3)
+    assert result["type"] == "anomaly"
+
+
+def test_ensure_dir_creates_each_directory_once(tmp_path, monkeypatch):
+    """Test repeated plots into one directory create it only once."""
+    created = []
+    real_mkdir = plots.Path.mkdir
+
+    def mkdir(self, *args, **kwargs):
+        created.append(self)
+        real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(plots.Path, "mkdir", mkdir)
+    monkeypatch.setattr(plots, "_CREATED_DIRS", set())
+    for name in ("a.png", "b.png"):
+        output = tmp_path / "out" / name
+        plots.plot_anomalies(pd.DataFrame(), "t", "v", "a", output_path=output)
+
+    assert created == [tmp_path / "out"]
+    assert (tmp_path / "out").is_dir()
+
+
+def test_save_recreates_directory_removed_after_first_use(frame, fake_plotsmith, tmp_path):
+    """Test a figures directory deleted between runs is recreated on save."""
+    output = tmp_path / "run" / "figures" / "load.png"
+    plots.plot_time_series(frame, "timestamp", "load", output_path=output)
+    shutil.rmtree(tmp_path / "run")
+
+    plots.plot_time_series(frame, "timestamp", "load", output_path=output)
+
+    assert output.exists()
+    assert len(fake_plotsmith.calls) == 3
+
+
+def test_plot_time_series_without_output_is_lazy(frame, fake_plotsmith):
+    """Test no render happens until the LazyPlot figure is used."""
+    result = plots.plot_time_series(frame, "timestamp", ["load", "forecast"], title="Load")
+
+    assert isinstance(result, plots.LazyPlot)
+    assert result["type"] == "time_series"
+    assert result.get("output_path") is None
+    assert fake_plotsmith.calls == []
+
+    result._evaluate()
+    result["figure"]
+    (call,) = fake_plotsmith.calls
+    assert call["title"] == "Load"
+    assert list(call["data"].columns) == ["load", "forecast"]
+
+    plots.plot_time_series(frame, "timestamp", "load", render=True)
+    assert len(fake_plotsmith.calls) == 2
+
+
+def test_plot_values_quantized_to_float32(frame, fake_plotsmith, fake_timesmith, monkeypatch):
+    """Test float columns reach the Smith libraries as float32 unless asked otherwise."""
+    monkeypatch.setenv("GRIDSMITH_SINGLECORE", "1")
+
+    plots.plot_time_series(frame, "timestamp", "load", render=True)
+    plots.plot_time_series(frame, "timestamp", "load", render=True, precision="float64")
+    plots.plot_forecast(frame, "timestamp", "load", "forecast")
+
+    assert [call["data"].dtype for call in fake_plotsmith.calls] == [np.float32, np.float64]
+    assert fake_timesmith.calls[0]["forecast"].dtype == np.float32
+    assert plots._quantize(pd.Series([1e39]), "float32").dtype == np.float64
+    assert plots._quantize(pd.Series([1, 2]), "float32").dtype == np.int64
+
+
+def test_plot_forecast_reuses_one_figure(frame, fake_timesmith, tmp_path, monkeypatch):
+    """Test reuse_fig draws every call into the same cleared figure."""
+    monkeypatch.setenv("GRIDSMITH_SINGLECORE", "1")
+    monkeypatch.setattr(plots, "_REUSABLE_FIG", None)
+    created = []
+
+    def subplots():
+        ax = FakeAxes()
+        ax.clear = lambda: ax.lines.append("cleared")
+        created.append((FakeFigure("reused"), ax))
+        return created[-1]
+
+    monkeypatch.setattr(plots, "_get_pyplot", lambda: types.SimpleNamespace(subplots=subplots))
+
+    for name in ("a.png", "b.png"):
+        plots.plot_forecast(
+            frame,
+            "timestamp",
+            "load",
+            "forecast",
+            output_path=tmp_path / name,
+            reuse_fig=True,
+            cache=False,
+        )
+
+    ((fig, ax),) = created
+    assert [call["ax"] for call in fake_timesmith.calls] == [ax, ax]
+    assert ax.lines == ["cleared"]
+    assert (tmp_path / "b.png").read_text() == "reused"
+
+
+def test_plot_cache_key_hashes_plotted_columns_only(frame):
+    """Test unplotted columns do not affect the key and string columns skip caching."""
+    columns = ["timestamp", "load"]
+    key = plots._plot_cache_key("time_series", frame, columns, None, None, {})
+    wide = frame.assign(meter_id="m1", extra=range(6))
+    wide_key = plots._plot_cache_key("time_series", wide, columns, None, None, {})
+
+    # Same dtypes and content hash; only the recorded frame shape differs
+    assert wide_key[1][1:] == key[1][1:]
+    assert plots._plot_cache_key("time_series", wide, ["meter_id"], None, None, {}) is None
+    reversed_key = plots._plot_cache_key("time_series", frame[::-1], columns, None, None, {})
+    assert reversed_key != key
+
+
+def test_plots_use_existing_datetime_index(frame, fake_plotsmith, fake_timesmith, monkeypatch):
+    """Test a timestamp index is plotted directly, by name or with None."""
+    monkeypatch.setenv("GRIDSMITH_SINGLECORE", "1")
+    indexed = frame.set_index("timestamp")
+
+    plots.plot_time_series(indexed, "timestamp", "load", render=True)
+    plots.plot_time_series(indexed, None, ["load", "forecast"], render=True)
+    plots.plot_forecast(indexed, None, "load", "forecast")
+
+    first, second = fake_plotsmith.calls
+    assert first["data"].index.equals(indexed.index)
+    assert list(second["data"].columns) == ["load", "forecast"]
+    (call,) = fake_timesmith.calls
+    assert list(call["forecast"].index) == list(indexed.index[3:])
+
+
+def test_multi_column_plot_data_is_c_contiguous(frame, fake_plotsmith):
+    """Test multi-column plot data reaches plotsmith as one C-contiguous array."""
+    for precision in ("float64", "float32"):
+        plots.plot_time_series(
+            frame, "timestamp", ["load", "forecast"], render=True, precision=precision
+        )
+
+    for call in fake_plotsmith.calls:
+        assert call["data"].to_numpy().flags["C_CONTIGUOUS"]
+    assert not frame[["load", "forecast"]].to_numpy().flags["C_CONTIGUOUS"]
+
+
+def test_plotsmith_failure_falls_back_and_is_remembered(frame, monkeypatch, tmp_path):
+    """Test incompatibilities fall back and are remembered; other errors are raised."""
+    calls = []
+    error = ValueError("empty series")
+
+    def plot_timeseries(data, **kwargs):
+        calls.append(kwargs)
+        raise error
+
+    module = types.SimpleNamespace(plot_timeseries=plot_timeseries)
+    monkeypatch.setattr(plots, "_get_plotsmith", lambda: module)
+    monkeypatch.setattr(plots, "_SMITH_FAIL_KEYS", set())
+
+    with pytest.raises(RuntimeError, match="empty series"):
+        plots.plot_time_series(frame, "timestamp", "load", output_path=tmp_path / "a.png")
+    assert plots._SMITH_FAIL_KEYS == set()
+
+    error = AttributeError("no attribute 'subplots'")
+    with pytest.warns(UserWarning, match="subplots"):
+        first = plots.plot_time_series(frame, "timestamp", "load", output_path=tmp_path / "b.png")
+    second = plots.plot_time_series(frame, "timestamp", "load", output_path=tmp_path / "c.png")
+    assert len(calls) == 2
+    assert second["type"] == "time_series"
+    assert "output_path" not in first and "output_path" not in second
+
+    plots.clear_plot_failures()
+    with pytest.warns(UserWarning):
+        plots.plot_time_series(frame, "timestamp", "load", output_path=tmp_path / "d.png")
+    assert len(calls) == 3
+
+
+def test_plot_forecast_save_errors_propagate(frame, monkeypatch, tmp_path):
+    """Test a savefig error surfaces instead of falling back to metadata."""
+
+    class BadFigure:
+        def savefig(self, path):
+            raise ValueError("Format 'xyz' is not supported")
+
+    module = types.SimpleNamespace(plot_forecast=lambda *args, **kwargs: (BadFigure(), None))
+    monkeypatch.setattr(plots, "_get_timesmith", lambda: module)
+    monkeypatch.setattr(plots, "_SMITH_FAIL_KEYS", set())
+
+    with pytest.raises(ValueError, match="not supported"):
+        plots.plot_forecast(frame, "timestamp", "load", "forecast", output_path=tmp_path / "f.xyz")
+    assert plots._SMITH_FAIL_KEYS == set()
+
+
+def test_render_forecasts_parallel(frame, fake_timesmith, tmp_path, monkeypatch):
+    """Test specs render in order, in-process or across spawned workers."""
+    wide = frame.assign(meter_id="m1")
+    specs = [
+        plots.ForecastSpec(wide, "timestamp", "load", "forecast", tmp_path / f"{i}.png", f"F{i}")
+        for i in range(3)
+    ]
+
+    monkeypatch.setenv("GRIDSMITH_SINGLECORE", "1")
+    results = plots.render_forecasts_parallel(specs)
+
+    assert [r["output_path"] for r in results] == [str(tmp_path / f"{i}.png") for i in range(3)]
+    assert all(r["data_shape"] == wide.shape for r in results)
+    assert (tmp_path / "2.png").read_text() == "F2"
+    assert len(fake_timesmith.calls) == 3
+
+    # Workers import the real (absent) libraries and return metadata only
+    monkeypatch.delenv("GRIDSMITH_SINGLECORE")
+    results = plots.render_forecasts_parallel(specs[:2], n_jobs=2)
+    assert [r["title"] for r in results] == ["F0", "F1"]